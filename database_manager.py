@@ -5,6 +5,7 @@ Soporta: PostgreSQL, MySQL, SQL Server, SQLite
 
 import sqlite3
 import logging
+import time
 from typing import Dict, Any, Optional, List, Tuple
 from sqlalchemy import create_engine, text, MetaData
 from sqlalchemy.engine import Engine
@@ -23,6 +24,11 @@ class DatabaseManager:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         self.engines: Dict[str, Engine] = {}
+        # Tipo y configuración con que se creó cada engine
+        self._engine_configs: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+        # Cache de esquemas: (db_type, host, port, database, user) -> (timestamp, esquemas)
+        self.schema_cache: Dict[Tuple[str, ...], Tuple[float, List[str]]] = {}
+        self.schema_cache_ttl = 30.0
         
     def create_connection_string(self, db_type: str, config: Dict[str, Any]) -> str:
         """Crea la cadena de conexión según el tipo de BD"""
@@ -74,13 +80,20 @@ class DatabaseManager:
             return False, f"Error: {str(e)}"
     
     def get_engine(self, connection_id: str, db_type: str, config: Dict[str, Any]) -> Engine:
-        """Obtiene o crea un engine SQLAlchemy para la conexión"""
+        """Obtiene o crea un engine SQLAlchemy para la conexión
+        
+        Si la configuración cambió desde que se creó el engine, se descarta y
+        se crea uno nuevo: así un mismo connection_id nunca apunta a otra BD.
+        """
         if connection_id in self.engines:
-            return self.engines[connection_id]
+            if self._engine_configs.get(connection_id) == (db_type, config):
+                return self.engines[connection_id]
+            self.dispose_engine(connection_id)
             
         connection_string = self.create_connection_string(db_type, config)
         engine = create_engine(connection_string, echo=False, pool_pre_ping=True)
         self.engines[connection_id] = engine
+        self._engine_configs[connection_id] = (db_type, dict(config))
         return engine
     
     def get_schemas(self, engine: Engine, db_type: str) -> List[str]:
@@ -136,6 +149,30 @@ class DatabaseManager:
             
         return schemas
     
+    def _schema_cache_key(self, db_type: str, config: Dict[str, Any]) -> Tuple[str, ...]:
+        """Clave de cache de esquemas (sin contraseña)"""
+        return (db_type.lower(),) + tuple(str(config.get(k, '')) for k in ('host', 'port', 'database', 'user'))
+    
+    def get_schemas_cached(self, engine: Engine, db_type: str, config: Dict[str, Any]) -> List[str]:
+        """Obtiene la lista de esquemas reutilizando resultados recientes"""
+        key = self._schema_cache_key(db_type, config)
+        cached = self.schema_cache.get(key)
+        if cached and time.monotonic() - cached[0] < self.schema_cache_ttl:
+            return list(cached[1])
+        
+        schemas = self.get_schemas(engine, db_type)
+        # No guardar listas vacías: get_schemas devuelve [] también ante errores
+        if schemas:
+            self.schema_cache[key] = (time.monotonic(), schemas)
+        return list(schemas)
+    
+    def invalidate_schema_cache(self, db_type: Optional[str] = None, config: Optional[Dict[str, Any]] = None):
+        """Descarta esquemas cacheados de una conexión o de todas"""
+        if db_type is None or config is None:
+            self.schema_cache.clear()
+        else:
+            self.schema_cache.pop(self._schema_cache_key(db_type, config), None)
+    
     def get_tables(self, engine: Engine, db_type: str, schema: str) -> List[str]:
         """Obtiene la lista de tablas en un esquema"""
         tables = []
@@ -341,8 +378,23 @@ class DatabaseManager:
             
         return table_info
     
+    def dispose_engine(self, connection_id: str):
+        """Cierra y descarta el engine de una conexión, si existe"""
+        engine = self.engines.pop(connection_id, None)
+        self._engine_configs.pop(connection_id, None)
+        if engine is None:
+            return
+        
+        try:
+            engine.dispose()
+        except Exception as e:
+            self.logger.error(f"Error al cerrar conexión {connection_id}: {str(e)}")
+    
     def close_all_connections(self):
-        """Cierra todas las conexiones abiertas"""
+        """Cierra todas las conexiones abiertas (sin efecto si ya están cerradas)"""
+        if not self.engines:
+            return
+        
         for connection_id, engine in self.engines.items():
             try:
                 engine.dispose()
@@ -350,6 +402,7 @@ class DatabaseManager:
                 self.logger.error(f"Error al cerrar conexión {connection_id}: {str(e)}")
         
         self.engines.clear()
+        self._engine_configs.clear()
     
     def execute_query(self, engine: Engine, query: str, params: Optional[Dict] = None) -> List[Dict]:
         """Ejecuta una consulta y retorna los resultados"""
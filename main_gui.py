@@ -5,23 +5,68 @@ Incluye conexiones, análisis, visualización de dependencias y configuración d
 
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
+import tkinter.font as tkfont
 import logging
 import threading
+import atexit
+import queue
 import json
-from typing import Dict, List, Optional, Any
+import hashlib
+import pickle
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 import os
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
 
 from database_manager import DatabaseManager
-from schema_analyzer import SchemaAnalyzer, SchemaInfo
+from schema_analyzer import SchemaAnalyzer, SchemaInfo, SchemaObjects
 from dependency_resolver import DependencyResolver
 from schema_exporter import SchemaExporter
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+@lru_cache(maxsize=1)
+def _oracle_config_path() -> Path:
+    """Ruta del archivo de configuración Oracle predefinido"""
+    return Path(__file__).resolve().parent / "config" / "oracle_config.json"
+
+
+@lru_cache(maxsize=1)
+def _about_text() -> str:
+    """Texto del diálogo 'Acerca de'"""
+    return ("Pasador de Esquemas de BD v1.0\n\n"
+            "Herramienta para transferir esquemas entre bases de datos\n"
+            "con análisis automático de dependencias.\n\n"
+            "Soporta: PostgreSQL, MySQL, SQL Server, Oracle, SQLite")
+
 
 class ConnectionFrame(ttk.LabelFrame):
     """Frame para configurar conexiones de base de datos"""
     
+    # Puerto por defecto según el tipo de base de datos
+    DEFAULT_PORTS = {
+        'postgresql': '5432',
+        'mysql': '3306',
+        'sql server': '1433',
+        'oracle': '1521',
+        'sqlite': ''
+    }
+    
+    # Campos que no aplican a SQLite
+    SQLITE_DISABLED = ('host_entry', 'port_entry', 'user_entry', 'password_entry')
+    
+    # Variable Tk de cada campo y su clave en la configuración
+    FIELDS = (('host_var', 'host'), ('port_var', 'port'), ('database_var', 'database'),
+              ('user_var', 'user'), ('password_var', 'password'))
+    
     def __init__(self, parent, title: str, connection_id: str):
         super().__init__(parent, text=title, padding="10")
         self.connection_id = connection_id
@@ -29,6 +74,13 @@ class ConnectionFrame(ttk.LabelFrame):
         self.schemas = []
         self.selected_schema = tk.StringVar()
         
+        # Valores de los campos; set() actualiza el Entry con un solo comando Tcl
+        for var_name, _ in self.FIELDS:
+            setattr(self, var_name, tk.StringVar())
+        
+        # Última configuración usada (sin contraseña) para rellenar el formulario
+        self._cfg_path = Path.home() / f".elpasador_{connection_id}.json"
+        
         self.setup_ui()
     
     def setup_ui(self):
@@ -43,13 +95,13 @@ class ConnectionFrame(ttk.LabelFrame):
         
         # Host
         ttk.Label(self, text="Host:").grid(row=1, column=0, sticky='w', padx=(0, 5))
-        self.host_entry = ttk.Entry(self, width=20)
+        self.host_entry = ttk.Entry(self, textvariable=self.host_var, width=20)
         self.host_entry.grid(row=1, column=1, sticky='ew', padx=(0, 10))
-        self.host_entry.insert(0, "localhost")
+        self.host_var.set("localhost")
         
         # Puerto
         ttk.Label(self, text="Puerto:").grid(row=2, column=0, sticky='w', padx=(0, 5))
-        self.port_entry = ttk.Entry(self, width=20)
+        self.port_entry = ttk.Entry(self, textvariable=self.port_var, width=20)
         self.port_entry.grid(row=2, column=1, sticky='ew', padx=(0, 10))
         
         # Base de datos
@@ -57,7 +109,7 @@ class ConnectionFrame(ttk.LabelFrame):
         self.database_frame = ttk.Frame(self)
         self.database_frame.grid(row=3, column=1, sticky='ew', padx=(0, 10))
         
-        self.database_entry = ttk.Entry(self.database_frame, width=15)
+        self.database_entry = ttk.Entry(self.database_frame, textvariable=self.database_var, width=15)
         self.database_entry.pack(side='left', fill='x', expand=True)
         
         self.browse_btn = ttk.Button(self.database_frame, text="...", width=3,
@@ -66,12 +118,12 @@ class ConnectionFrame(ttk.LabelFrame):
         
         # Usuario
         ttk.Label(self, text="Usuario:").grid(row=4, column=0, sticky='w', padx=(0, 5))
-        self.user_entry = ttk.Entry(self, width=20)
+        self.user_entry = ttk.Entry(self, textvariable=self.user_var, width=20)
         self.user_entry.grid(row=4, column=1, sticky='ew', padx=(0, 10))
         
         # Contraseña
         ttk.Label(self, text="Contraseña:").grid(row=5, column=0, sticky='w', padx=(0, 5))
-        self.password_entry = ttk.Entry(self, show="*", width=20)
+        self.password_entry = ttk.Entry(self, textvariable=self.password_var, show="*", width=20)
         self.password_entry.grid(row=5, column=1, sticky='ew', padx=(0, 10))
         
         # Botones
@@ -86,6 +138,10 @@ class ConnectionFrame(ttk.LabelFrame):
                                      command=self.connect)
         self.connect_btn.pack(side='left')
         
+        self.refresh_btn = ttk.Button(button_frame, text="Refrescar",
+                                     command=self.refresh)
+        self.refresh_btn.pack(side='left', padx=(5, 0))
+        
         # Esquemas disponibles
         ttk.Label(self, text="Esquemas:").grid(row=7, column=0, sticky='nw', padx=(0, 5), pady=(10, 0))
         
@@ -108,37 +164,53 @@ class ConnectionFrame(ttk.LabelFrame):
         self.columnconfigure(1, weight=1)
         
         self.on_db_type_changed()
+        self._load_config()
+    
+    def _load_config(self):
+        """Restaura la última configuración de conexión guardada"""
+        if not self._cfg_path.exists():
+            return
+        
+        try:
+            with open(self._cfg_path, 'r', encoding='utf-8') as f:
+                config = json.load(f)
+        except (OSError, ValueError) as e:
+            logging.getLogger(__name__).warning(f"No se pudo leer {self._cfg_path}: {e}")
+            return
+        
+        if config.get('db_type'):
+            self.db_type.set(config['db_type'])
+            self.on_db_type_changed()
+        
+        for var_name, key in self.FIELDS:
+            if key in config:
+                getattr(self, var_name).set(config[key])
+    
+    def _save_config(self, config: Dict[str, str]):
+        """Guarda la configuración de conexión (sin contraseña) de forma atómica"""
+        data = {k: v for k, v in config.items() if k != 'password'}
+        tmp_path = self._cfg_path.with_suffix('.tmp')
+        
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2)
+            os.replace(tmp_path, self._cfg_path)
+        except OSError as e:
+            logging.getLogger(__name__).warning(f"No se pudo guardar {self._cfg_path}: {e}")
     
     def on_db_type_changed(self, event=None):
         """Maneja cambios en el tipo de base de datos"""
         db_type = self.db_type.get().lower()
         
         # Configurar puerto por defecto
-        default_ports = {
-            'postgresql': '5432',
-            'mysql': '3306',
-            'sql server': '1433',
-            'oracle': '1521',
-            'sqlite': ''
-        }
-        
-        self.port_entry.delete(0, tk.END)
-        if db_type in default_ports:
-            self.port_entry.insert(0, default_ports[db_type])
+        self.port_var.set(self.DEFAULT_PORTS.get(db_type, ''))
         
         # Habilitar/deshabilitar campos según el tipo
-        if db_type == 'sqlite':
-            self.host_entry.config(state='disabled')
-            self.port_entry.config(state='disabled')
-            self.user_entry.config(state='disabled')
-            self.password_entry.config(state='disabled')
-            self.browse_btn.config(state='normal')
-        else:
-            self.host_entry.config(state='normal')
-            self.port_entry.config(state='normal')
-            self.user_entry.config(state='normal')
-            self.password_entry.config(state='normal')
-            self.browse_btn.config(state='disabled')
+        is_sqlite = db_type == 'sqlite'
+        state = 'disabled' if is_sqlite else 'normal'
+        for name in self.SQLITE_DISABLED:
+            getattr(self, name).config(state=state)
+        self.browse_btn.config(state='normal' if is_sqlite else 'disabled')
     
     def browse_database(self):
         """Busca archivo de base de datos SQLite"""
@@ -147,18 +219,17 @@ class ConnectionFrame(ttk.LabelFrame):
             filetypes=[("SQLite files", "*.db *.sqlite *.sqlite3"), ("All files", "*.*")]
         )
         if filename:
-            self.database_entry.delete(0, tk.END)
-            self.database_entry.insert(0, filename)
+            self.database_var.set(filename)
     
     def get_connection_config(self) -> Dict[str, str]:
         """Obtiene la configuración de conexión"""
         config = {
             'db_type': self.db_type.get(),
-            'host': self.host_entry.get(),
-            'port': self.port_entry.get(),
-            'database': self.database_entry.get(),
-            'user': self.user_entry.get(),
-            'password': self.password_entry.get()
+            'host': self.host_var.get(),
+            'port': self.port_var.get(),
+            'database': self.database_var.get(),
+            'user': self.user_var.get(),
+            'password': self.password_var.get()
         }
         return config
     
@@ -175,7 +246,6 @@ class ConnectionFrame(ttk.LabelFrame):
             return
         
         try:
-            from main_gui import MainGUI
             app = self.winfo_toplevel().app
             success, message = app.db_manager.test_connection(config['db_type'], config)
             
@@ -194,23 +264,42 @@ class ConnectionFrame(ttk.LabelFrame):
         config = self.get_connection_config()
         
         try:
-            from main_gui import MainGUI
             app = self.winfo_toplevel().app
-            engine = app.db_manager.get_engine(self.connection_id, config['db_type'], config)
-            schemas = app.db_manager.get_schemas(engine, config['db_type'])
-            
-            # Actualizar lista de esquemas
-            self.schema_listbox.delete(0, tk.END)
-            for schema in schemas:
-                self.schema_listbox.insert(tk.END, schema)
-            
-            self.connection_config = config
-            self.schemas = schemas
-            self.status_label.config(text=f"Conectado - {len(schemas)} esquemas", foreground='green')
-            
+            schemas = self.fetch_schemas(app.db_manager, config)
         except Exception as e:
-            messagebox.showerror("Error", f"Error al conectar: {str(e)}")
-            self.status_label.config(text="Error de conexión", foreground='red')
+            self.on_connect_error(e)
+            return
+        
+        self.on_schemas_loaded(config, schemas)
+    
+    def refresh(self):
+        """Descarta los esquemas cacheados y vuelve a conectar"""
+        config = self.get_connection_config()
+        if config['db_type']:
+            self.winfo_toplevel().app.db_manager.invalidate_schema_cache(config['db_type'], config)
+        self.connect()
+    
+    def fetch_schemas(self, db_manager: DatabaseManager, config: Dict[str, str]) -> List[str]:
+        """Obtiene los esquemas de la conexión (sin tocar widgets, apto para hilos)"""
+        engine = db_manager.get_engine(self.connection_id, config['db_type'], config)
+        return db_manager.get_schemas_cached(engine, config['db_type'], config)
+    
+    def on_schemas_loaded(self, config: Dict[str, str], schemas: List[str]):
+        """Actualiza el frame con los esquemas obtenidos"""
+        # Actualizar lista de esquemas
+        self.schema_listbox.delete(0, tk.END)
+        if schemas:
+            self.schema_listbox.insert(tk.END, *schemas)
+        
+        self.connection_config = config
+        self.schemas = schemas
+        self.status_label.config(text=f"Conectado - {len(schemas)} esquemas", foreground='green')
+        self._save_config(config)
+    
+    def on_connect_error(self, error: Exception):
+        """Muestra un error de conexión"""
+        messagebox.showerror("Error", f"Error al conectar: {str(error)}")
+        self.status_label.config(text="Error de conexión", foreground='red')
     
     def get_selected_schema(self) -> Optional[str]:
         """Obtiene el esquema seleccionado"""
@@ -223,6 +312,9 @@ class ConnectionFrame(ttk.LabelFrame):
 class TableSelectionDialog:
     """Diálogo para seleccionar tablas específicas"""
     
+    CHECKED = '☑'
+    UNCHECKED = '☐'
+    
     def __init__(self, parent, tables: List[str], title: str = "Seleccionar Tablas"):
         self.parent = parent
         self.tables = tables
@@ -235,7 +327,6 @@ class TableSelectionDialog:
         """Configura el diálogo de selección"""
         self.dialog = tk.Toplevel(self.parent)
         self.dialog.title(title)
-        self.dialog.geometry("400x500")
         self.dialog.transient(self.parent)
         self.dialog.grab_set()
         
@@ -243,35 +334,30 @@ class TableSelectionDialog:
         main_frame = ttk.Frame(self.dialog, padding="10")
         main_frame.pack(fill='both', expand=True)
         
-        # Lista de tablas con checkboxes
+        # Lista de tablas
         ttk.Label(main_frame, text="Selecciona las tablas a transferir:").pack(anchor='w')
         
         # Frame para la lista con scrollbar
         list_frame = ttk.Frame(main_frame)
         list_frame.pack(fill='both', expand=True, pady=(10, 0))
         
-        # Canvas y scrollbar para manejar muchas tablas
-        canvas = tk.Canvas(list_frame)
-        scrollbar = ttk.Scrollbar(list_frame, orient="vertical", command=canvas.yview)
-        scrollable_frame = ttk.Frame(canvas)
+        # Treeview con columna de marca: Tk solo dibuja las filas visibles
+        # Un byte por tabla (0/1) en lugar de una variable Tk por fila
+        self._bits = bytearray(len(self.tables))
+        self.tree = ttk.Treeview(list_frame, columns=('sel',), show='tree headings', selectmode='none')
+        self.tree.heading('#0', text='Tabla')
+        self.tree.heading('sel', text='Transferir')
+        self.tree.column('sel', width=80, anchor='center', stretch=False)
         
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
+        scrollbar = ttk.Scrollbar(list_frame, orient="vertical", command=self.tree.yview)
+        self.tree.configure(yscrollcommand=scrollbar.set)
         
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
+        for i, table in enumerate(self.tables):
+            self.tree.insert('', 'end', iid=str(i), text=table, values=(self.UNCHECKED,))
         
-        # Variables para checkboxes
-        self.table_vars = {}
-        for table in self.tables:
-            var = tk.BooleanVar()
-            checkbox = ttk.Checkbutton(scrollable_frame, text=table, variable=var)
-            checkbox.pack(anchor='w', padx=5, pady=2)
-            self.table_vars[table] = var
+        self.tree.bind('<Button-1>', self.on_click)
         
-        canvas.pack(side="left", fill="both", expand=True)
+        self.tree.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
         
         # Botones de selección
@@ -292,28 +378,39 @@ class TableSelectionDialog:
         ttk.Button(button_frame, text="Cancelar", 
                   command=self.cancel).pack(side='right')
         
-        # Centrar diálogo
-        self.dialog.update_idletasks()
-        x = (self.dialog.winfo_screenwidth() // 2) - (self.dialog.winfo_width() // 2)
-        y = (self.dialog.winfo_screenheight() // 2) - (self.dialog.winfo_height() // 2)
-        self.dialog.geometry(f"+{x}+{y}")
+        # Centrar diálogo con el tamaño conocido, sin forzar un pase de layout
+        w, h = 400, 500
+        x = (self.dialog.winfo_screenwidth() - w) // 2
+        y = (self.dialog.winfo_screenheight() - h) // 2
+        self.dialog.geometry(f"{w}x{h}+{x}+{y}")
+    
+    def on_click(self, event):
+        """Alterna la marca de la tabla sobre la que se hizo clic"""
+        item = self.tree.identify_row(event.y)
+        if not item:
+            return
+        
+        i = int(item)
+        self._bits[i] ^= 1
+        self.tree.set(item, 'sel', self.CHECKED if self._bits[i] else self.UNCHECKED)
     
     def select_all(self):
         """Selecciona todas las tablas"""
-        for var in self.table_vars.values():
-            var.set(True)
+        self._set_all(1, self.CHECKED)
     
     def deselect_all(self):
         """Deselecciona todas las tablas"""
-        for var in self.table_vars.values():
-            var.set(False)
+        self._set_all(0, self.UNCHECKED)
+    
+    def _set_all(self, bit: int, mark: str):
+        """Marca o desmarca todas las tablas"""
+        self._bits[:] = bytes([bit]) * len(self.tables)
+        for item in self.tree.get_children():
+            self.tree.set(item, 'sel', mark)
     
     def accept(self):
         """Acepta la selección"""
-        self.selected_tables = [
-            table for table, var in self.table_vars.items() 
-            if var.get()
-        ]
+        self.selected_tables = [table for table, bit in zip(self.tables, self._bits) if bit]
         self.result = 'accepted'
         self.dialog.destroy()
     
@@ -330,13 +427,172 @@ class TableSelectionDialog:
         return None
 
 
+class VirtualGrid(tk.Canvas):
+    """Tabla de solo lectura sobre un Canvas que dibuja únicamente las filas visibles
+    
+    Para listados muy grandes: a diferencia de ttk.Treeview no crea un elemento
+    por fila, así que cada redibujo cuesta lo mismo sin importar el total.
+    Implementa yview() para conectarse a un ttk.Scrollbar.
+    """
+    
+    PADDING = 4
+    HEADER_BG = '#e8e8e8'
+    LINE_COLOR = '#c0c0c0'
+    
+    def __init__(self, parent, columns, widths, yscrollcommand=None, **kwargs):
+        kwargs.setdefault('background', 'white')
+        kwargs.setdefault('highlightthickness', 0)
+        super().__init__(parent, **kwargs)
+        
+        self.columns = tuple(columns)
+        self.widths = tuple(widths)
+        self._yscrollcommand = yscrollcommand
+        self.font = tkfont.nametofont('TkDefaultFont')
+        self.row_height = self.font.metrics('linespace') + self.PADDING
+        
+        self._rows = []
+        self._first = 0
+        
+        self.bind('<Configure>', lambda e: self._redraw())
+        self.bind('<MouseWheel>', self._on_mousewheel)
+        self.bind('<Button-4>', lambda e: self.yview('scroll', -3, 'units'))
+        self.bind('<Button-5>', lambda e: self.yview('scroll', 3, 'units'))
+    
+    def set_rows(self, rows: List[tuple]):
+        """Reemplaza los datos mostrados"""
+        self._rows = rows
+        self._first = max(0, min(self._first, len(rows) - self._visible_count()))
+        self._redraw()
+    
+    def yview(self, *args):
+        """Desplaza la vista según el protocolo de Scrollbar ('moveto' / 'scroll')"""
+        total = len(self._rows)
+        if not args:
+            return self._fractions()
+        
+        visible = self._visible_count()
+        if args[0] == 'moveto':
+            first = int(float(args[1]) * total)
+        elif args[0] == 'scroll':
+            step = visible if args[2] == 'pages' else 1
+            first = self._first + int(args[1]) * step
+        else:
+            return None
+        
+        self._first = max(0, min(first, total - visible))
+        self._redraw()
+        return None
+    
+    def _on_mousewheel(self, event):
+        """Desplaza con la rueda del mouse (Windows/macOS)"""
+        self.yview('scroll', -3 if event.delta > 0 else 3, 'units')
+    
+    def _visible_count(self) -> int:
+        """Cantidad de filas que entran en la altura actual, sin el encabezado"""
+        return max(1, self.winfo_height() // self.row_height - 1)
+    
+    def _fractions(self):
+        """Fracción visible del total, como la espera Scrollbar.set"""
+        total = len(self._rows)
+        if not total:
+            return 0.0, 1.0
+        last = min(self._first + self._visible_count(), total)
+        return self._first / total, last / total
+    
+    def _fit(self, text: str, width: int) -> str:
+        """Recorta el texto con '…' para que entre en el ancho de la celda"""
+        available = width - 2 * self.PADDING
+        if self.font.measure(text) <= available:
+            return text
+        low, high = 0, len(text)
+        while low < high:
+            middle = (low + high + 1) // 2
+            if self.font.measure(text[:middle] + '…') <= available:
+                low = middle
+            else:
+                high = middle - 1
+        return text[:low] + '…'
+    
+    def _cell_widths(self) -> List[int]:
+        """Anchos de columna; la última ocupa el espacio restante"""
+        widths = list(self.widths)
+        widths[-1] = max(widths[-1], self.winfo_width() - sum(widths[:-1]))
+        return widths
+    
+    def _redraw(self):
+        """Dibuja el encabezado y solo las filas dentro de la vista"""
+        self.delete('all')
+        widths = self._cell_widths()
+        row_height = self.row_height
+        middle = row_height // 2
+        
+        # Encabezado
+        self.create_rectangle(0, 0, sum(widths), row_height, fill=self.HEADER_BG, outline=self.LINE_COLOR)
+        x = 0
+        for column, width in zip(self.columns, widths):
+            self.create_text(x + self.PADDING, middle, anchor='w', font=self.font,
+                             text=self._fit(column, width))
+            x += width
+            self.create_line(x, 0, x, row_height, fill=self.LINE_COLOR)
+        
+        # Filas visibles
+        last = min(self._first + self._visible_count() + 1, len(self._rows))
+        y = row_height
+        for row in self._rows[self._first:last]:
+            x = 0
+            for value, width in zip(row, widths):
+                self.create_text(x + self.PADDING, y + middle, anchor='w', font=self.font,
+                                 text=self._fit(str(value), width))
+                x += width
+            y += row_height
+        
+        if self._yscrollcommand is not None:
+            self._yscrollcommand(*self._fractions())
+
+
 class SchemaVisualizationFrame(ttk.LabelFrame):
     """Frame para visualizar información del esquema y dependencias"""
     
+    # Filas que se materializan por bloque en los Treeview con carga perezosa
+    LAZY_CHUNK = 200
+    
+    # Prefijos de índices generados por el sistema (no se muestran)
+    SYSTEM_INDEX_PREFIXES = ('PK_', 'FK_', 'SYS_')
+    
     def __init__(self, parent):
         super().__init__(parent, text="Análisis del Esquema", padding="10")
         self.schema_info: Optional[SchemaInfo] = None
         self.dependency_resolver = DependencyResolver()
+        self._validation_analyzer = SchemaAnalyzer(None)  # No necesitamos db_manager para validación
+        
+        # Filas de la tabla de objetos, calculadas una vez por carga
+        self._table_rows = []
+        
+        # Cache de grafo/árbol de dependencias por esquema (id(schema_info))
+        self._graph_cache = {}
+        self._tree_cache = {}
+        self._issues_cache = {}
+        self._cycle_strings = {}
+        self._cycle_summaries = {}
+        
+        # Árbol de dependencias mostrado y correspondencia item -> nodo (carga perezosa)
+        self._dep_tree = None
+        self._iid_to_nodeid = {}
+        self._placeholder_iids = set()
+        
+        # Filas aún no insertadas por Treeview (carga al hacer scroll)
+        self._pending_rows = {}
+        # Treeviews con una carga de filas ya programada
+        self._load_scheduled = set()
+        
+        # Filas materializadas por nombre en los Treeview con actualización incremental
+        self._tree_rows = {}
+        
+        # Generación de la carga en segundo plano de la pestaña de objetos
+        self._objects_generation = 0
+        
+        # Callback pendiente de la selección en el árbol de dependencias (debounce)
+        self._sel_after = None
         
         self.setup_ui()
     
@@ -379,8 +635,8 @@ class SchemaVisualizationFrame(ttk.LabelFrame):
         info_frame = ttk.LabelFrame(self.summary_frame, text="Información General", padding="5")
         info_frame.pack(fill='x', pady=(0, 10))
         
-        self.info_text = tk.Text(info_frame, height=6, wrap='word')
-        self.info_text.pack(fill='x')
+        self._info_var = tk.StringVar()
+        ttk.Label(info_frame, textvariable=self._info_var, justify='left', anchor='nw').pack(fill='x')
         
         # Lista de tablas
         tables_frame = ttk.LabelFrame(self.summary_frame, text="Tablas", padding="5")
@@ -429,7 +685,11 @@ class SchemaVisualizationFrame(ttk.LabelFrame):
         self.deps_detail.pack(fill='x')
         
         # Bind para mostrar detalles
-        self.deps_tree.bind('<<TreeviewSelect>>', self.on_dependency_select)
+        self.deps_tree.bind('<<TreeviewSelect>>', self._on_dependency_select_debounced)
+        
+        # Los hijos se cargan al expandir un nodo y se descargan al colapsarlo
+        self.deps_tree.bind('<<TreeviewOpen>>', self._on_dep_tree_open)
+        self.deps_tree.bind('<<TreeviewClose>>', self._on_dep_tree_close)
     
     def setup_order_tab(self):
         """Configura la pestaña de orden de transferencia"""
@@ -480,7 +740,7 @@ class SchemaVisualizationFrame(ttk.LabelFrame):
             self.objects_tables_tree.column(col, width=100)
         
         tables_scroll = ttk.Scrollbar(tables_frame, orient='vertical', command=self.objects_tables_tree.yview)
-        self.objects_tables_tree.configure(yscrollcommand=tables_scroll.set)
+        self._bind_lazy_scroll(self.objects_tables_tree, tables_scroll)
         self.objects_tables_tree.pack(side='left', fill='both', expand=True)
         tables_scroll.pack(side='right', fill='y')
         
@@ -496,7 +756,7 @@ class SchemaVisualizationFrame(ttk.LabelFrame):
             self.objects_views_tree.column(col, width=150)
         
         views_scroll = ttk.Scrollbar(views_frame, orient='vertical', command=self.objects_views_tree.yview)
-        self.objects_views_tree.configure(yscrollcommand=views_scroll.set)
+        self._bind_lazy_scroll(self.objects_views_tree, views_scroll)
         self.objects_views_tree.pack(side='left', fill='both', expand=True)
         views_scroll.pack(side='right', fill='y')
         
@@ -512,7 +772,7 @@ class SchemaVisualizationFrame(ttk.LabelFrame):
             self.objects_sequences_tree.column(col, width=100)
         
         sequences_scroll = ttk.Scrollbar(sequences_frame, orient='vertical', command=self.objects_sequences_tree.yview)
-        self.objects_sequences_tree.configure(yscrollcommand=sequences_scroll.set)
+        self._bind_lazy_scroll(self.objects_sequences_tree, sequences_scroll)
         self.objects_sequences_tree.pack(side='left', fill='both', expand=True)
         sequences_scroll.pack(side='right', fill='y')
         
@@ -528,7 +788,7 @@ class SchemaVisualizationFrame(ttk.LabelFrame):
             self.objects_procedures_tree.column(col, width=120)
         
         procedures_scroll = ttk.Scrollbar(procedures_frame, orient='vertical', command=self.objects_procedures_tree.yview)
-        self.objects_procedures_tree.configure(yscrollcommand=procedures_scroll.set)
+        self._bind_lazy_scroll(self.objects_procedures_tree, procedures_scroll)
         self.objects_procedures_tree.pack(side='left', fill='both', expand=True)
         procedures_scroll.pack(side='right', fill='y')
         
@@ -544,7 +804,7 @@ class SchemaVisualizationFrame(ttk.LabelFrame):
             self.objects_triggers_tree.column(col, width=120)
         
         triggers_scroll = ttk.Scrollbar(triggers_frame, orient='vertical', command=self.objects_triggers_tree.yview)
-        self.objects_triggers_tree.configure(yscrollcommand=triggers_scroll.set)
+        self._bind_lazy_scroll(self.objects_triggers_tree, triggers_scroll)
         self.objects_triggers_tree.pack(side='left', fill='both', expand=True)
         triggers_scroll.pack(side='right', fill='y')
         
@@ -552,19 +812,13 @@ class SchemaVisualizationFrame(ttk.LabelFrame):
         indexes_frame = ttk.Frame(objects_notebook)
         objects_notebook.add(indexes_frame, text="📇 Índices")
         
+        # Puede tener decenas de miles de filas: grilla virtual en lugar de Treeview
         columns = ('Índice', 'Tabla', 'Tipo', 'Único', 'Columnas')
-        self.objects_indexes_tree = ttk.Treeview(indexes_frame, columns=columns, show='headings')
-        
-        for col in columns:
-            self.objects_indexes_tree.heading(col, text=col)
-            if col == 'Columnas':
-                self.objects_indexes_tree.column(col, width=200)
-            else:
-                self.objects_indexes_tree.column(col, width=120)
-        
-        indexes_scroll = ttk.Scrollbar(indexes_frame, orient='vertical', command=self.objects_indexes_tree.yview)
-        self.objects_indexes_tree.configure(yscrollcommand=indexes_scroll.set)
-        self.objects_indexes_tree.pack(side='left', fill='both', expand=True)
+        indexes_scroll = ttk.Scrollbar(indexes_frame, orient='vertical')
+        self.objects_indexes_grid = VirtualGrid(indexes_frame, columns, (120, 120, 120, 120, 200),
+                                                yscrollcommand=indexes_scroll.set)
+        indexes_scroll.configure(command=self.objects_indexes_grid.yview)
+        self.objects_indexes_grid.pack(side='left', fill='both', expand=True)
         indexes_scroll.pack(side='right', fill='y')
 
     def setup_issues_tab(self):
@@ -592,14 +846,65 @@ class SchemaVisualizationFrame(ttk.LabelFrame):
     
     def update_schema_info(self, schema_info: SchemaInfo):
         """Actualiza la visualización con nueva información del esquema"""
+        self._graph_cache.clear()
+        self._tree_cache.clear()
+        self._issues_cache.clear()
+        self._cycle_strings.clear()
+        self._cycle_summaries.clear()
         self.schema_info = schema_info
         
+        # Filas de tablas en una sola pasada; no cambian hasta la próxima carga
+        self._table_rows = [
+            (table_name, table.row_count_str, len(table.columns),
+             len(table.foreign_keys), len(table.dependencies))
+            for table_name, table in schema_info.objects.tables.items()
+        ]
+        
         self.update_summary_tab()
         self.update_dependencies_tab()
         self.update_order_tab()
         self.update_objects_tab()
         self.update_issues_tab()
     
+    def _get_graph(self, schema_info: SchemaInfo):
+        """Obtiene el grafo de dependencias, construyéndolo una sola vez por esquema"""
+        key = id(schema_info)
+        if key not in self._graph_cache:
+            self._graph_cache[key] = self.dependency_resolver.create_dependency_graph(schema_info)
+        return self._graph_cache[key]
+    
+    def _get_tree(self, schema_info: SchemaInfo):
+        """Obtiene el árbol de dependencias, construyéndolo una sola vez por esquema"""
+        key = id(schema_info)
+        if key not in self._tree_cache:
+            self._tree_cache[key] = self.dependency_resolver.create_dependency_tree(schema_info)
+        return self._tree_cache[key]
+    
+    def _get_cycle_strings(self, schema_info: SchemaInfo) -> List[str]:
+        """Obtiene los ciclos del grafo ya formateados ('a -> b -> a'), una vez por esquema"""
+        key = id(schema_info)
+        if key not in self._cycle_strings:
+            cycles = self._get_graph(schema_info).cycles
+            self._cycle_strings[key] = [' -> '.join(cycle) for cycle in cycles]
+        return self._cycle_strings[key]
+    
+    def _get_cycle_summaries(self, schema_info: SchemaInfo) -> List[str]:
+        """Obtiene los ciclos abreviados a sus tres primeras tablas, una vez por esquema"""
+        key = id(schema_info)
+        if key not in self._cycle_summaries:
+            cycles = self._get_graph(schema_info).cycles
+            self._cycle_summaries[key] = [
+                " → ".join(cycle[:3]) + ("..." if len(cycle) > 3 else "") for cycle in cycles
+            ]
+        return self._cycle_summaries[key]
+    
+    def _get_issues(self, schema_info: SchemaInfo) -> List[Dict[str, Any]]:
+        """Obtiene los problemas de integridad, validando una sola vez por esquema"""
+        key = id(schema_info)
+        if key not in self._issues_cache:
+            self._issues_cache[key] = self._validation_analyzer.validate_schema_integrity(schema_info)
+        return self._issues_cache[key]
+    
     def update_summary_tab(self):
         """Actualiza la pestaña de resumen"""
         if not self.schema_info:
@@ -613,8 +918,7 @@ class SchemaVisualizationFrame(ttk.LabelFrame):
         total_triggers = len(self.schema_info.objects.triggers)
         total_indexes = len(self.schema_info.objects.indexes)
         
-        total_rows = sum(table.row_count for table in self.schema_info.objects.tables.values())
-        total_fks = sum(len(table.foreign_keys) for table in self.schema_info.objects.tables.values())
+        levels_count = len(set(self._get_graph(self.schema_info).levels.values()))
         
         info_text = f"""Esquema: {self.schema_info.schema_name}
 
@@ -627,26 +931,15 @@ class SchemaVisualizationFrame(ttk.LabelFrame):
 📇 Índices: {total_indexes}
 
 === ESTADÍSTICAS DE DATOS ===
-Filas totales: {total_rows:,}
-Llaves foráneas: {total_fks}
-Niveles de dependencia: {len(set(self.dependency_resolver.create_dependency_graph(self.schema_info).levels.values()))}
+Filas totales: {self.schema_info.total_rows:,}
+Llaves foráneas: {self.schema_info.total_fks}
+Niveles de dependencia: {levels_count}
 """
         
-        self.info_text.delete(1.0, tk.END)
-        self.info_text.insert(1.0, info_text)
+        self._info_var.set(info_text)
         
         # Lista de tablas
-        for item in self.tables_tree.get_children():
-            self.tables_tree.delete(item)
-        
-        for table_name, table_info in self.schema_info.objects.tables.items():
-            self.tables_tree.insert('', 'end', values=(
-                table_name,
-                f"{table_info.row_count:,}",
-                len(table_info.columns),
-                len(table_info.foreign_keys),
-                len(table_info.dependencies)
-            ))
+        self._fill_tree(self.tables_tree, self._table_rows)
     
     def update_dependencies_tab(self):
         """Actualiza la pestaña de dependencias"""
@@ -654,26 +947,21 @@ Niveles de dependencia: {len(set(self.dependency_resolver.create_dependency_grap
             return
         
         # Limpiar árbol existente
-        for item in self.deps_tree.get_children():
-            self.deps_tree.delete(item)
+        self._clear_tree(self.deps_tree)
+        self._dep_tree = None
+        self._iid_to_nodeid.clear()
+        self._placeholder_iids.clear()
         
         try:
             # Crear árbol de dependencias
-            dep_tree = self.dependency_resolver.create_dependency_tree(self.schema_info)
-            
-            # Agregar nodos al treeview de forma recursiva
-            def add_tree_nodes(node_id, parent_id=''):
-                node = dep_tree.get_node(node_id)
-                item_id = self.deps_tree.insert(parent_id, 'end', text=node.tag)
-                
-                # Obtener hijos usando el método correcto de treelib
-                children = dep_tree.children(node_id)
-                for child in children:
-                    add_tree_nodes(child.identifier, item_id)
+            dep_tree = self._get_tree(self.schema_info)
             
-            # Agregar raíz y sus hijos si el árbol no está vacío
+            # Agregar la raíz y sus hijos directos; el resto se carga al expandir
             if dep_tree.root is not None:
-                add_tree_nodes(dep_tree.root)
+                self._dep_tree = dep_tree
+                root_item = self._insert_dep_node(dep_tree.root, '')
+                self.deps_tree.item(root_item, open=True)
+                self._load_dep_children(root_item)
             else:
                 self.deps_tree.insert('', 'end', text="📋 Sin dependencias detectadas")
             
@@ -687,183 +975,366 @@ Niveles de dependencia: {len(set(self.dependency_resolver.create_dependency_grap
                 self.deps_tree.insert('', 'end', text="📊 Vista Simplificada de Dependencias")
                 
                 # Agrupar tablas por número de dependencias
-                dependency_graph = self.dependency_resolver.create_dependency_graph(self.schema_info)
+                dependency_graph = self._get_graph(self.schema_info)
+                
+                # Separar tablas raíz y con dependencias en una sola pasada
+                root_tables = []
+                dep_tables = []
+                for table, deps in dependency_graph.nodes.items():
+                    if deps:
+                        dep_tables.append(f"📋 {table} ({len(deps)} deps)")
+                    else:
+                        root_tables.append(f"📋 {table}")
+                root_tables.sort()
+                dep_tables.sort()
                 
                 # Tablas sin dependencias (raíces)
-                root_tables = [table for table, deps in dependency_graph.nodes.items() if not deps]
                 if root_tables:
                     root_item = self.deps_tree.insert('', 'end', text="🌱 Tablas Raíz (sin dependencias)")
-                    for table in sorted(root_tables):
-                        self.deps_tree.insert(root_item, 'end', text=f"📋 {table}")
+                    for text in root_tables:
+                        self.deps_tree.insert(root_item, 'end', text=text)
                 
                 # Tablas con dependencias
-                dep_tables = [table for table, deps in dependency_graph.nodes.items() if deps]
                 if dep_tables:
                     dep_item = self.deps_tree.insert('', 'end', text="🔗 Tablas con Dependencias")
-                    for table in sorted(dep_tables):
-                        dep_count = len(dependency_graph.nodes[table])
-                        self.deps_tree.insert(dep_item, 'end', text=f"📋 {table} ({dep_count} deps)")
+                    for text in dep_tables:
+                        self.deps_tree.insert(dep_item, 'end', text=text)
                 
                 # Ciclos detectados
                 if dependency_graph.cycles:
                     cycles_item = self.deps_tree.insert('', 'end', text="🔄 Dependencias Circulares")
-                    for i, cycle in enumerate(dependency_graph.cycles, 1):
-                        cycle_text = " → ".join(cycle[:3]) + ("..." if len(cycle) > 3 else "")
+                    for i, cycle_text in enumerate(self._get_cycle_summaries(self.schema_info), 1):
                         self.deps_tree.insert(cycles_item, 'end', text=f"⚠️ Ciclo {i}: {cycle_text}")
                 
             except Exception as fallback_error:
                 self.deps_tree.insert('', 'end', text=f"❌ Error: {str(e)}")
                 self.deps_tree.insert('', 'end', text="💡 Usa la pestaña 'Orden' para ver dependencias básicas")
     
+    def _insert_dep_node(self, node_id: str, parent_id: str) -> str:
+        """Inserta un nodo del árbol de dependencias sin materializar sus hijos"""
+        node = self._dep_tree.get_node(node_id)
+        item_id = self.deps_tree.insert(parent_id, 'end', text=node.tag)
+        self._iid_to_nodeid[item_id] = node_id
+        
+        # Marcador para que aparezca la flecha de expansión
+        if self._dep_tree.is_branch(node_id):
+            self._placeholder_iids.add(self.deps_tree.insert(item_id, 'end', text='…'))
+        return item_id
+    
+    def _load_dep_children(self, item_id: str):
+        """Reemplaza el marcador de un item por sus hijos reales"""
+        children = self.deps_tree.get_children(item_id)
+        if not children or children[0] not in self._placeholder_iids:
+            return
+        
+        self._placeholder_iids.discard(children[0])
+        self.deps_tree.delete(children[0])
+        
+        for child_id in self._dep_tree.is_branch(self._iid_to_nodeid[item_id]):
+            self._insert_dep_node(child_id, item_id)
+    
+    def _on_dep_tree_open(self, event):
+        """Carga los hijos del nodo expandido"""
+        item_id = self.deps_tree.focus()
+        if self._dep_tree is not None and item_id in self._iid_to_nodeid:
+            self._load_dep_children(item_id)
+    
+    def _on_dep_tree_close(self, event):
+        """Descarga los descendientes del nodo colapsado para limitar la memoria"""
+        item_id = self.deps_tree.focus()
+        if self._dep_tree is None or item_id not in self._iid_to_nodeid:
+            return
+        
+        children = self.deps_tree.get_children(item_id)
+        if not children or children[0] in self._placeholder_iids:
+            return
+        
+        # Olvidar los items descendientes antes de eliminarlos
+        pending = list(children)
+        while pending:
+            child = pending.pop()
+            self._iid_to_nodeid.pop(child, None)
+            self._placeholder_iids.discard(child)
+            pending.extend(self.deps_tree.get_children(child))
+        
+        self.deps_tree.delete(*children)
+        self._placeholder_iids.add(self.deps_tree.insert(item_id, 'end', text='…'))
+    
     def update_order_tab(self):
         """Actualiza la pestaña de orden"""
         if not self.schema_info:
             return
         
-        # Limpiar orden existente
-        for item in self.order_tree.get_children():
-            self.order_tree.delete(item)
-        
         # Crear grafo de dependencias y obtener niveles
-        dep_graph = self.dependency_resolver.create_dependency_graph(self.schema_info)
+        dep_graph = self._get_graph(self.schema_info)
+        
+        # Agregar tablas en orden; el tiempo estimado es muy básico (1ms por fila)
+        levels = dep_graph.levels
+        tables = self.schema_info.objects.tables
+        rows = [
+            (i, levels.get(table_name, 0), table_name,
+             tables[table_name].row_count_str, f"{tables[table_name].row_count * 0.001:.1f}s")
+            for i, table_name in enumerate(self.schema_info.dependency_order, 1)
+            if table_name in tables
+        ]
         
-        # Agregar tablas en orden
-        for i, table_name in enumerate(self.schema_info.dependency_order):
-            if table_name in self.schema_info.objects.tables:
-                table_info = self.schema_info.objects.tables[table_name]
-                level = dep_graph.levels.get(table_name, 0)
-                
-                # Estimar tiempo (muy básico)
-                est_time = table_info.row_count * 0.001  # 1ms por fila
-                
-                self.order_tree.insert('', 'end', values=(
-                    i + 1,
-                    level,
-                    table_name,
-                    f"{table_info.row_count:,}",
-                    f"{est_time:.1f}s"
-                ))
+        self._fill_tree(self.order_tree, rows)
     
     def update_objects_tab(self):
-        """Actualiza la pestaña de todos los objetos"""
+        """Actualiza la pestaña de todos los objetos
+        
+        Las filas se arman en un hilo de trabajo y se aplican en el hilo de Tk
+        un Treeview por tick, para no congelar la interfaz. Cada Treeview se
+        actualiza de forma incremental (ver _sync_tree).
+        """
         if not self.schema_info:
             return
         
-        # Actualizar tablas
-        for item in self.objects_tables_tree.get_children():
-            self.objects_tables_tree.delete(item)
-        
-        for table_name, table_info in self.schema_info.objects.tables.items():
-            self.objects_tables_tree.insert('', 'end', values=(
-                table_name,
-                f"{table_info.row_count:,}",
-                len(table_info.columns),
-                len(table_info.foreign_keys),
-                len(table_info.dependencies)
-            ))
-        
-        # Actualizar vistas
-        for item in self.objects_views_tree.get_children():
-            self.objects_views_tree.delete(item)
-        
-        for view_name, view_info in self.schema_info.objects.views.items():
-            self.objects_views_tree.insert('', 'end', values=(
-                view_name,
-                "Sí" if view_info.is_updatable else "No",
-                len(view_info.dependencies),
-                len(view_info.columns)
-            ))
-        
-        # Actualizar secuencias
-        for item in self.objects_sequences_tree.get_children():
-            self.objects_sequences_tree.delete(item)
-        
-        for seq_name, seq_info in self.schema_info.objects.sequences.items():
-            self.objects_sequences_tree.insert('', 'end', values=(
-                seq_name,
-                seq_info.start_value,
-                seq_info.increment_by,
-                seq_info.min_value or "N/A",
-                seq_info.max_value or "N/A",
-                "Sí" if seq_info.cycle_flag else "No"
-            ))
-        
-        # Actualizar procedimientos
-        for item in self.objects_procedures_tree.get_children():
-            self.objects_procedures_tree.delete(item)
-        
-        for proc_name, proc_info in self.schema_info.objects.procedures.items():
-            self.objects_procedures_tree.insert('', 'end', values=(
-                proc_name,
-                proc_info.procedure_type,
-                proc_info.language,
-                len(proc_info.parameters),
-                len(proc_info.dependencies)
-            ))
-        
-        # Actualizar triggers
-        for item in self.objects_triggers_tree.get_children():
-            self.objects_triggers_tree.delete(item)
-        
-        for trigger_name, trigger_info in self.schema_info.objects.triggers.items():
-            self.objects_triggers_tree.insert('', 'end', values=(
-                trigger_name,
-                trigger_info.table_name,
-                trigger_info.trigger_type,
-                trigger_info.triggering_event,
-                trigger_info.status
-            ))
-        
-        # Actualizar índices (solo los no automáticos)
-        for item in self.objects_indexes_tree.get_children():
-            self.objects_indexes_tree.delete(item)
-        
-        for index_name, index_info in self.schema_info.objects.indexes.items():
-            # Filtrar índices del sistema
-            if not self._is_system_index(index_info):
-                self.objects_indexes_tree.insert('', 'end', values=(
-                    index_name,
-                    index_info.table_name,
-                    index_info.index_type,
-                    "Sí" if index_info.is_unique else "No",
-                    ", ".join(index_info.columns)
-                ))
+        # Invalida cualquier carga anterior que siga en curso
+        self._objects_generation += 1
+        generation = self._objects_generation
+        
+        results = queue.Queue()
+        objects = self.schema_info.objects
+        
+        # Las filas de tablas ya están calculadas
+        results.put((self.objects_tables_tree, self._table_rows))
+        
+        def build_rows():
+            # Solo estructuras de Python: ninguna llamada a Tk fuera del hilo principal
+            try:
+                # Vistas
+                results.put((self.objects_views_tree, [
+                    (view_name, "Sí" if view_info.is_updatable else "No",
+                     len(view_info.dependencies), len(view_info.columns))
+                    for view_name, view_info in objects.views.items()
+                ]))
+                
+                # Secuencias
+                results.put((self.objects_sequences_tree, [
+                    (seq_name, seq_info.start_value, seq_info.increment_by,
+                     seq_info.min_value or "N/A", seq_info.max_value or "N/A",
+                     "Sí" if seq_info.cycle_flag else "No")
+                    for seq_name, seq_info in objects.sequences.items()
+                ]))
+                
+                # Procedimientos
+                results.put((self.objects_procedures_tree, [
+                    (proc_name, proc_info.procedure_type, proc_info.language,
+                     len(proc_info.parameters), len(proc_info.dependencies))
+                    for proc_name, proc_info in objects.procedures.items()
+                ]))
+                
+                # Triggers
+                results.put((self.objects_triggers_tree, [
+                    (trigger_name, trigger_info.table_name, trigger_info.trigger_type,
+                     trigger_info.triggering_event, trigger_info.status)
+                    for trigger_name, trigger_info in objects.triggers.items()
+                ]))
+                
+                # Índices (solo los no automáticos)
+                results.put((self.objects_indexes_grid, [
+                    (index_name, index_info.table_name, index_info.index_type,
+                     "Sí" if index_info.is_unique else "No", ", ".join(index_info.columns))
+                    for index_name, index_info in objects.indexes.items()
+                    if not self._is_system_index(index_info)
+                ]))
+            except Exception as e:
+                logging.getLogger(__name__).error(f"Error preparando objetos del esquema: {e}", exc_info=True)
+            finally:
+                results.put(None)
+        
+        threading.Thread(target=build_rows, daemon=True).start()
+        self.after(0, self._drain_object_rows, results, generation)
+    
+    def _drain_object_rows(self, results: queue.Queue, generation: int):
+        """Inserta en el hilo de Tk las filas preparadas, un Treeview por tick"""
+        if generation != self._objects_generation:
+            return
+        
+        try:
+            item = results.get_nowait()
+        except queue.Empty:
+            self.after(16, self._drain_object_rows, results, generation)
+            return
+        
+        if item is None:
+            return
+        
+        tree, rows = item
+        if isinstance(tree, VirtualGrid):
+            tree.set_rows(rows)
+        else:
+            self._sync_tree(tree, rows)
+        self.after(16, self._drain_object_rows, results, generation)
     
     def _is_system_index(self, index_info) -> bool:
         """Determina si un índice es del sistema"""
-        index_name = index_info.index_name.upper()
-        return (index_name.startswith('PK_') or 
-                index_name.startswith('FK_') or
-                index_name.startswith('SYS_'))
+        return index_info.index_name.upper().startswith(self.SYSTEM_INDEX_PREFIXES)
 
     def update_issues_tab(self):
         """Actualiza la pestaña de problemas"""
         if not self.schema_info:
             return
         
-        # Limpiar problemas existentes
-        for item in self.issues_tree.get_children():
-            self.issues_tree.delete(item)
-        
         # Validar integridad del esquema
-        analyzer = SchemaAnalyzer(None)  # No necesitamos db_manager para validación
-        issues = analyzer.validate_schema_integrity(self.schema_info)
-        
-        for issue in issues:
-            self.issues_tree.insert('', 'end', values=(
-                issue['type'],
-                issue.get('table', 'N/A'),
-                issue['description']
-            ))
-        
-        # Detectar ciclos
-        dep_graph = self.dependency_resolver.create_dependency_graph(self.schema_info)
-        for i, cycle in enumerate(dep_graph.cycles):
-            self.issues_tree.insert('', 'end', values=(
-                'circular_dependency',
-                ' -> '.join(cycle),
-                f'Dependencia circular detectada: {" -> ".join(cycle)}'
-            ))
+        issues = self._get_issues(self.schema_info)
+        
+        rows = [
+            (issue['type'], issue.get('table', 'N/A'), issue['description'])
+            for issue in issues
+        ]
+        
+        # Ciclos detectados en el grafo de dependencias
+        rows.extend(
+            ('circular_dependency', cycle_path, f'Dependencia circular detectada: {cycle_path}')
+            for cycle_path in self._get_cycle_strings(self.schema_info)
+        )
+        
+        self._fill_tree(self.issues_tree, rows)
+    
+    def _clear_tree(self, tree: ttk.Treeview):
+        """Elimina todos los elementos de un Treeview con una sola llamada"""
+        self._pending_rows.pop(tree, None)
+        self._tree_rows.pop(tree, None)
+        children = tree.get_children()
+        if children:
+            tree.delete(*children)
+    
+    @contextmanager
+    def _frozen(self, tree: ttk.Treeview, detach: bool = False):
+        """Suspende el layout de un Treeview mientras se modifican sus filas
+        
+        Oculta las columnas y, con detach=True, retira el widget del pack y lo
+        vuelve a empaquetar al final en la misma posición.
+        """
+        pack_info = None
+        if detach and tree.winfo_manager() == 'pack':
+            pack_info = tree.pack_info()
+            siblings = tree.master.pack_slaves()
+            position = siblings.index(tree)
+            if position + 1 < len(siblings):
+                pack_info['before'] = siblings[position + 1]
+            tree.pack_forget()
+        
+        display_columns = tree['displaycolumns']
+        tree.configure(displaycolumns=())
+        try:
+            yield
+        finally:
+            tree.configure(displaycolumns=display_columns)
+            if pack_info is not None:
+                tree.pack(**pack_info)
+    
+    def _fill_tree(self, tree: ttk.Treeview, rows: List[tuple], detach: bool = False,
+                   lazy: bool = False):
+        """Reemplaza el contenido de un Treeview insertando las filas en bloque
+        
+        Con lazy=True solo se insertan las primeras LAZY_CHUNK filas; el resto
+        se agrega al hacer scroll (ver _bind_lazy_scroll).
+        """
+        self._clear_tree(tree)
+        
+        if lazy and len(rows) > self.LAZY_CHUNK:
+            self._pending_rows[tree] = rows[self.LAZY_CHUNK:]
+            rows = rows[:self.LAZY_CHUNK]
+        
+        with self._frozen(tree, detach):
+            # Insertar al inicio en orden inverso: Tk recorre los hermanos hasta
+            # la posición indicada, así que 'end' cuesta O(n) por fila y 0 es O(1)
+            for values in reversed(rows):
+                tree.insert('', 0, values=values)
+    
+    def _sync_tree(self, tree: ttk.Treeview, rows: List[tuple]):
+        """Actualiza un Treeview aplicando solo las diferencias con su contenido
+        
+        Cada fila se identifica por su primer valor (el nombre del objeto), que
+        se usa como iid. Se eliminan las filas que ya no existen, se insertan
+        las nuevas y se actualizan las que cambiaron; el resto no se toca. Se
+        mantienen materializadas tantas filas como antes (mínimo LAZY_CHUNK) y
+        las demás quedan pendientes para la carga al hacer scroll.
+        """
+        if tree not in self._tree_rows:
+            # Contenido sin iid por nombre (o vacío): se parte de cero
+            self._clear_tree(tree)
+        current = self._tree_rows.get(tree, {})
+        limit = max(len(current), self.LAZY_CHUNK)
+        visible = rows[:limit]
+        new = {row[0]: row for row in visible}
+        if len(new) != len(visible):
+            # Nombres repetidos: no sirven como iid, se reconstruye completo
+            self._fill_tree(tree, rows, detach=True, lazy=True)
+            return
+        
+        removed = [key for key in current if key not in new]
+        # Filas que siguen existiendo pero en otro orden relativo
+        reordered = ([key for key in current if key in new] !=
+                     [key for key in new if key in current])
+        changed = removed or reordered or len(new) != len(current) or any(
+            current.get(key) != row for key, row in new.items()
+        )
+        
+        if changed:
+            with self._frozen(tree, detach=True):
+                if removed:
+                    tree.delete(*removed)
+                for position, row in enumerate(visible):
+                    old = current.get(row[0])
+                    if old is None:
+                        tree.insert('', position, iid=row[0], values=row)
+                        continue
+                    if reordered:
+                        # Las posiciones previas ya están en orden: basta moverla a la suya
+                        tree.move(row[0], '', position)
+                    if old != row:
+                        tree.item(row[0], values=row)
+        
+        self._tree_rows[tree] = new
+        if len(rows) > limit:
+            self._pending_rows[tree] = rows[limit:]
+        else:
+            self._pending_rows.pop(tree, None)
+    
+    def _bind_lazy_scroll(self, tree: ttk.Treeview, scrollbar: ttk.Scrollbar):
+        """Conecta el scroll vertical y carga más filas al acercarse al final"""
+        def on_scroll(first, last):
+            scrollbar.set(first, last)
+            # Tk llama varias veces por scroll: un solo bloque por vez
+            if (float(last) >= 0.9 and self._pending_rows.get(tree)
+                    and tree not in self._load_scheduled):
+                self._load_scheduled.add(tree)
+                self.after_idle(self._load_more_rows, tree)
+        
+        tree.configure(yscrollcommand=on_scroll)
+    
+    def _load_more_rows(self, tree: ttk.Treeview):
+        """Inserta el siguiente bloque de filas pendientes de un Treeview"""
+        self._load_scheduled.discard(tree)
+        rows = self._pending_rows.get(tree)
+        if not rows:
+            return
+        
+        chunk = rows[:self.LAZY_CHUNK]
+        del rows[:self.LAZY_CHUNK]
+        
+        keyed_rows = self._tree_rows.get(tree)
+        for values in chunk:
+            if keyed_rows is None:
+                tree.insert('', 'end', values=values)
+            else:
+                tree.insert('', 'end', iid=values[0], values=values)
+                keyed_rows[values[0]] = values
+    
+    def _on_dependency_select_debounced(self, event):
+        """Agrupa selecciones rápidas (p. ej. con flechas) en una sola actualización"""
+        if self._sel_after:
+            self.after_cancel(self._sel_after)
+        self._sel_after = self.after(80, self._run_dependency_select, event)
+    
+    def _run_dependency_select(self, event):
+        """Ejecuta la actualización de detalles pendiente"""
+        self._sel_after = None
+        self.on_dependency_select(event)
     
     def on_dependency_select(self, event):
         """Maneja la selección en el árbol de dependencias"""
@@ -880,16 +1351,17 @@ Niveles de dependencia: {len(set(self.dependency_resolver.create_dependency_grap
             deps = self.dependency_resolver.get_table_dependencies(self.schema_info, table_name)
             
             detail_text = f"""Tabla: {table_name}
-Filas: {table_info.row_count:,}
+Filas: {table_info.row_count_str}
 Columnas: {len(table_info.columns)}
 
 Dependencias directas: {', '.join(deps['direct']) if deps['direct'] else 'Ninguna'}
 Dependencias indirectas: {', '.join(deps['indirect']) if deps['indirect'] else 'Ninguna'}
 
 Llaves foráneas:
-"""
-            for fk in table_info.foreign_keys:
-                detail_text += f"  {fk.column_name} -> {fk.referenced_table}.{fk.referenced_column}\n"
+""" + "".join(
+                f"  {fk.column_name} -> {fk.referenced_table}.{fk.referenced_column}\n"
+                for fk in table_info.foreign_keys
+            )
             
             self.deps_detail.delete(1.0, tk.END)
             self.deps_detail.insert(1.0, detail_text)
@@ -933,20 +1405,24 @@ Llaves foráneas:
                 plan = {
                     'schema_name': self.schema_info.schema_name,
                     'transfer_order': self.schema_info.dependency_order,
-                    'tables': {},
+                    'tables': {
+                        table_name: {
+                            'row_count': table_info.row_count,
+                            'columns': len(table_info.columns),
+                            'foreign_keys': len(table_info.foreign_keys),
+                            'dependencies': list(table_info.dependencies)
+                        }
+                        for table_name, table_info in self.schema_info.objects.tables.items()
+                    },
                     'created_at': datetime.now().isoformat()
                 }
                 
-                for table_name, table_info in self.schema_info.objects.tables.items():
-                    plan['tables'][table_name] = {
-                        'row_count': table_info.row_count,
-                        'columns': len(table_info.columns),
-                        'foreign_keys': len(table_info.foreign_keys),
-                        'dependencies': list(table_info.dependencies)
-                    }
-                
-                with open(filename, 'w', encoding='utf-8') as f:
-                    json.dump(plan, f, indent=2, ensure_ascii=False)
+                if orjson is not None:
+                    with open(filename, 'wb') as f:
+                        f.write(orjson.dumps(plan, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+                else:
+                    with open(filename, 'w', encoding='utf-8') as f:
+                        json.dump(plan, f, indent=2, ensure_ascii=False)
                 
                 messagebox.showinfo("Éxito", f"Plan exportado a: {filename}")
                 
@@ -957,6 +1433,43 @@ Llaves foráneas:
 class MainGUI:
     """Ventana principal de la aplicación"""
     
+    # Esquemas analizados guardados en disco para recargarlos sin introspección
+    SCHEMA_CACHE_DIR = Path.home() / ".elpasador_cache"
+    SCHEMA_CACHE_TTL = 24 * 3600  # segundos
+    SCHEMA_CACHE_FORMAT = 3  # versión de SchemaInfo guardada
+    
+    # Por formato: (diálogo de filedialog, sus opciones, método de SchemaExporter, usa BD destino)
+    EXPORT_SPECS = {
+        'sql': ('asksaveasfilename',
+                {'title': "Guardar DDL SQL", 'defaultextension': ".sql",
+                 'filetypes': [("SQL files", "*.sql"), ("All files", "*.*")]},
+                'export_to_sql_ddl', True),
+        'json': ('asksaveasfilename',
+                 {'title': "Guardar JSON", 'defaultextension': ".json",
+                  'filetypes': [("JSON files", "*.json"), ("All files", "*.*")]},
+                 'export_to_json', False),
+        'html': ('asksaveasfilename',
+                 {'title': "Guardar Reporte HTML", 'defaultextension': ".html",
+                  'filetypes': [("HTML files", "*.html"), ("All files", "*.*")]},
+                 'export_to_html_report', False),
+        'csv': ('askdirectory',
+                {'title': "Seleccionar directorio para CSVs"},
+                'export_to_csv_summary', False)
+    }
+    
+    # Opciones de los radio buttons del diálogo de exportar: (texto, valor)
+    EXPORT_OPTIONS = (
+        ("📄 SQL DDL (Crear scripts de estructura)", "sql"),
+        ("📋 JSON (Metadatos completos)", "json"),
+        ("🌐 HTML (Reporte visual)", "html"),
+        ("📊 CSV (Resúmenes por tipo)", "csv")
+    )
+    DB_OPTIONS = (
+        ("Oracle", "oracle"),
+        ("PostgreSQL", "postgresql"),
+        ("SQL Server", "sqlserver")
+    )
+    
     def __init__(self):
         self.root = tk.Tk()
         self.root.title("Pasador de Esquemas de BD")
@@ -968,10 +1481,20 @@ class MainGUI:
         self.dependency_resolver = DependencyResolver()
         self.schema_exporter = SchemaExporter()
         
+        # Hilo de trabajo reutilizado por todas las exportaciones
+        self._export_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='export')
+        atexit.register(self._export_pool.shutdown, wait=False)
+        
+        # Diálogo de exportar, creado la primera vez que se abre
+        self._export_dialog: Optional[tk.Toplevel] = None
+        
         # Variables de estado
         self.source_schema_info: Optional[SchemaInfo] = None
         self.target_connection_config = {}
         
+        # Configuración Oracle ya leída, por (ruta, mtime)
+        self._oracle_cfg_cache = {}
+        
         # Configurar logging
         logging.basicConfig(level=logging.INFO,
                           format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -1034,6 +1557,11 @@ class MainGUI:
         self.target_frame = ConnectionFrame(left_frame, "Base de Datos Destino", "target")
         self.target_frame.pack(fill='both', expand=True)
         
+        # Conectar origen y destino a la vez
+        self.connect_both_btn = ttk.Button(left_frame, text="Conectar Ambas",
+                                          command=self.connect_both)
+        self.connect_both_btn.pack(fill='x', pady=(10, 0))
+        
         # Panel derecho - Visualización y transferencia
         right_frame = ttk.Frame(main_paned)
         main_paned.add(right_frame, weight=2)
@@ -1096,6 +1624,44 @@ class MainGUI:
         menubar.add_cascade(label="Ayuda", menu=help_menu)
         help_menu.add_command(label="Acerca de", command=self.show_about)
     
+    def connect_both(self):
+        """Conecta origen y destino en paralelo y carga sus esquemas"""
+        frames = [(frame, frame.get_connection_config())
+                  for frame in (self.source_frame, self.target_frame)]
+        
+        for frame, config in frames:
+            if not config['db_type'] or not config['database']:
+                messagebox.showerror("Error", "Completa la configuración de origen y destino")
+                return
+        
+        self.connect_both_btn.config(state='disabled')
+        self.progress_var.set("Conectando origen y destino...")
+        
+        def connect_thread():
+            # El tiempo total es el de la conexión más lenta, no la suma de ambas
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                futures = [
+                    (frame, config, executor.submit(frame.fetch_schemas, self.db_manager, config))
+                    for frame, config in frames
+                ]
+            
+            for frame, config, future in futures:
+                try:
+                    schemas = future.result()
+                except Exception as e:
+                    self.root.after(0, frame.on_connect_error, e)
+                else:
+                    self.root.after(0, frame.on_schemas_loaded, config, schemas)
+            
+            self.root.after(0, self.on_connect_both_complete)
+        
+        threading.Thread(target=connect_thread, daemon=True).start()
+    
+    def on_connect_both_complete(self):
+        """Restaura el estado tras conectar ambas bases de datos"""
+        self.connect_both_btn.config(state='normal')
+        self.progress_var.set("Listo para analizar esquema")
+    
     def analyze_schema(self):
         """Analiza el esquema seleccionado"""
         selected_schema = self.source_frame.get_selected_schema()
@@ -1112,27 +1678,42 @@ class MainGUI:
         self.progress_bar.start()
         self.analyze_btn.config(state='disabled')
         
+        # Leer las opciones en el hilo principal: las variables Tk no son thread-safe
+        config = self.source_frame.connection_config
+        options = {
+            'include_views': self.include_views_var.get(),
+            'include_procedures': self.include_procedures_var.get(),
+            'include_sequences': self.include_sequences_var.get(),
+            'include_triggers': self.include_triggers_var.get(),
+            'include_indexes': self.include_indexes_var.get()
+        }
+        
         def analyze_thread():
             try:
-                config = self.source_frame.connection_config
-                engine = self.db_manager.get_engine("source", config['db_type'], config)
+                cache_key = self._schema_cache_key(config, selected_schema, options)
+                # get_engine recrea el engine si la configuración cambió, así
+                # que el análisis siempre corresponde a la clave con que se guarda
+                cached = self._load_cached_schema(cache_key)
+                schema_info, cached_at = cached if cached else (None, None)
                 
-                # Obtener lista de tablas para selección opcional
-                all_tables = self.db_manager.get_tables(engine, config['db_type'], selected_schema)
+                if schema_info is None:
+                    engine = self.db_manager.get_engine("source", config['db_type'], config)
+                    
+                    # Obtener lista de tablas para selección opcional
+                    all_tables = self.db_manager.get_tables(engine, config['db_type'], selected_schema)
+                    
+                    # Analizar esquema con opciones seleccionadas
+                    schema_info = self.schema_analyzer.analyze_schema(
+                        engine, config['db_type'], selected_schema,
+                        selected_tables=None,  # Todas las tablas por ahora
+                        **options
+                    )
+                    self._store_cached_schema(cache_key, schema_info)
                 
-                # Analizar esquema con opciones seleccionadas
-                self.source_schema_info = self.schema_analyzer.analyze_schema(
-                    engine, config['db_type'], selected_schema,
-                    selected_tables=None,  # Todas las tablas por ahora
-                    include_views=self.include_views_var.get(),
-                    include_procedures=self.include_procedures_var.get(),
-                    include_sequences=self.include_sequences_var.get(),
-                    include_triggers=self.include_triggers_var.get(),
-                    include_indexes=self.include_indexes_var.get()
-                )
+                self.source_schema_info = schema_info
                 
                 # Actualizar UI en hilo principal
-                self.root.after(0, self.on_analysis_complete)
+                self.root.after(0, self.on_analysis_complete, cached_at)
                 
             except Exception as e:
                 error_msg = f"Error analizando esquema: {str(e)}"
@@ -1140,10 +1721,77 @@ class MainGUI:
         
         threading.Thread(target=analyze_thread, daemon=True).start()
     
-    def on_analysis_complete(self):
-        """Maneja la finalización del análisis"""
+    def _schema_cache_key(self, config: Dict[str, str], schema_name: str,
+                          options: Dict[str, bool]) -> Dict[str, Any]:
+        """Identifica un análisis: conexión, esquema y opciones usadas"""
+        return {
+            # Cambia cuando cambian los campos de SchemaInfo (invalida pickles viejos)
+            'format': self.SCHEMA_CACHE_FORMAT,
+            'db_type': config['db_type'].lower(),
+            'host': str(config.get('host', '')),
+            'port': str(config.get('port', '')),
+            'database': str(config.get('database', '')),
+            # Los objetos visibles dependen de los privilegios del usuario
+            'user': str(config.get('user', '')),
+            'schema': schema_name,
+            'options': options
+        }
+    
+    def _schema_cache_paths(self, key: Dict[str, Any]):
+        """Rutas del pickle y de su archivo JSON con la clave"""
+        digest = hashlib.sha256(json.dumps(key, sort_keys=True).encode('utf-8')).hexdigest()
+        return self.SCHEMA_CACHE_DIR / f"{digest}.pkl", self.SCHEMA_CACHE_DIR / f"{digest}.json"
+    
+    def _load_cached_schema(self, key: Dict[str, Any]) -> Optional[Tuple[SchemaInfo, float]]:
+        """Carga un análisis guardado si existe, no venció y corresponde a la clave
+        
+        Retorna el análisis y el momento (timestamp) en que se guardó.
+        """
+        pickle_path, key_path = self._schema_cache_paths(key)
+        
+        try:
+            if not pickle_path.exists():
+                return None
+            saved_at = pickle_path.stat().st_mtime
+            if time.time() - saved_at > self.SCHEMA_CACHE_TTL:
+                return None
+            
+            with open(key_path, 'r', encoding='utf-8') as f:
+                if json.load(f) != key:
+                    return None
+            
+            with open(pickle_path, 'rb') as f:
+                return pickle.load(f), saved_at
+        except (OSError, ValueError, EOFError, AttributeError, pickle.UnpicklingError) as e:
+            logging.getLogger(__name__).warning(f"No se pudo leer el cache de esquema {pickle_path}: {e}")
+            return None
+    
+    def _store_cached_schema(self, key: Dict[str, Any], schema_info: SchemaInfo):
+        """Guarda un análisis en disco de forma atómica"""
+        pickle_path, key_path = self._schema_cache_paths(key)
+        tmp_path = pickle_path.with_suffix('.tmp')
+        
+        try:
+            self.SCHEMA_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            with open(key_path, 'w', encoding='utf-8') as f:
+                json.dump(key, f, indent=2)
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(schema_info, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, pickle_path)
+        except (OSError, pickle.PicklingError) as e:
+            logging.getLogger(__name__).warning(f"No se pudo guardar el cache de esquema {pickle_path}: {e}")
+    
+    def on_analysis_complete(self, cached_at: Optional[float] = None):
+        """Maneja la finalización del análisis
+        
+        cached_at indica cuándo se guardó el análisis si vino del cache en disco.
+        """
         self.progress_bar.stop()
-        self.progress_var.set("Análisis completado")
+        if cached_at is None:
+            self.progress_var.set("Análisis completado")
+        else:
+            saved = datetime.fromtimestamp(cached_at).strftime('%d/%m/%Y %H:%M')
+            self.progress_var.set(f"Análisis cargado del cache (guardado el {saved})")
         self.analyze_btn.config(state='normal')
         
         if self.source_schema_info:
@@ -1156,13 +1804,10 @@ class MainGUI:
             self.export_btn.config(state='normal')
             
             # Mostrar resumen
-            total_tables = len(self.source_schema_info.objects.tables)
-            total_rows = sum(t.row_count for t in self.source_schema_info.objects.tables.values())
-            
             messagebox.showinfo("Análisis Completo", 
                               f"Esquema analizado exitosamente:\n"
-                              f"Tablas: {total_tables}\n"
-                              f"Filas totales: {total_rows:,}")
+                              f"Tablas: {self.source_schema_info.total_tables}\n"
+                              f"Filas totales: {self.source_schema_info.total_rows:,}")
     
     def on_analysis_error(self, error_msg: str):
         """Maneja errores en el análisis"""
@@ -1182,21 +1827,35 @@ class MainGUI:
         
         if selected_tables:
             # Crear nueva instancia de schema_info solo con las tablas seleccionadas
+            selected_set = set(selected_tables)
             filtered_tables = {name: info for name, info in self.source_schema_info.objects.tables.items() 
-                             if name in selected_tables}
+                             if name in selected_set}
             
             if filtered_tables:
                 # Crear nuevo schema_info con tablas filtradas
+                source_objects = self.source_schema_info.objects
+                filtered_objects = SchemaObjects(
+                    tables=filtered_tables,
+                    views=source_objects.views,
+                    sequences=source_objects.sequences,
+                    procedures=source_objects.procedures,
+                    triggers={name: info for name, info in source_objects.triggers.items()
+                              if info.table_name in selected_set},
+                    indexes={name: info for name, info in source_objects.indexes.items()
+                             if info.table_name in selected_set}
+                )
                 filtered_schema = SchemaInfo(
                     schema_name=self.source_schema_info.schema_name,
-                    tables=filtered_tables,
-                    dependency_order=[]
+                    objects=filtered_objects,
+                    dependency_order=[],
+                    creation_order=[]
                 )
                 
                 # Recalcular dependencias y orden
-                analyzer = SchemaAnalyzer(self.db_manager)
-                analyzer._calculate_dependencies(filtered_schema)
-                filtered_schema.dependency_order = analyzer._calculate_insertion_order(filtered_schema)
+                self.schema_analyzer._calculate_dependencies(filtered_schema)
+                filtered_schema.dependency_order = self.schema_analyzer._calculate_insertion_order(filtered_schema)
+                filtered_schema.creation_order = self.schema_analyzer._calculate_creation_order(filtered_schema)
+                filtered_schema.update_totals()
                 
                 # Actualizar schema_info y visualización
                 self.source_schema_info = filtered_schema
@@ -1220,12 +1879,10 @@ class MainGUI:
             return
         
         # Confirmación
-        total_tables = len(self.source_schema_info.objects.tables)
-        total_rows = sum(t.row_count for t in self.source_schema_info.objects.tables.values())
-        
         result = messagebox.askyesno(
             "Confirmar Transferencia",
-            f"¿Iniciar transferencia de {total_tables} tablas ({total_rows:,} filas)?\n\n"
+            f"¿Iniciar transferencia de {self.source_schema_info.total_tables} tablas "
+            f"({self.source_schema_info.total_rows:,} filas)?\n\n"
             f"Origen: {self.source_schema_info.schema_name}\n"
             f"Destino: {target_schema}\n\n"
             f"Esta operación puede tomar tiempo y modificar datos."
@@ -1390,150 +2047,199 @@ Descripción: {conn.get('description', 'N/A')}"""
         frame.db_type.set(conn_config.get('type', ''))
         frame.on_db_type_changed()  # Actualizar campos habilitados
         
-        frame.host_entry.delete(0, tk.END)
-        frame.host_entry.insert(0, conn_config.get('host', ''))
-        
-        frame.port_entry.delete(0, tk.END)
-        frame.port_entry.insert(0, str(conn_config.get('port', '')))
-        
-        frame.database_entry.delete(0, tk.END)
-        frame.database_entry.insert(0, conn_config.get('database', ''))
-        
-        frame.user_entry.delete(0, tk.END)
-        frame.user_entry.insert(0, conn_config.get('user', ''))
-        
-        frame.password_entry.delete(0, tk.END)
-        frame.password_entry.insert(0, conn_config.get('password', ''))
+        for var_name, key in frame.FIELDS:
+            getattr(frame, var_name).set(str(conn_config.get(key, '')))
     
     def load_legacy_config(self, config):
         """Carga configuración en formato antiguo"""
-        # Cargar configuración origen
-        if 'source' in config:
-            src_config = config['source']
-            self.source_frame.db_type.set(src_config.get('db_type', ''))
-            self.source_frame.host_entry.delete(0, tk.END)
-            self.source_frame.host_entry.insert(0, src_config.get('host', ''))
-            # ... otros campos
-        
-        # Cargar configuración destino
-        if 'target' in config:
-            tgt_config = config['target']
-            self.target_frame.db_type.set(tgt_config.get('db_type', ''))
-            # ... otros campos
+        for key, frame in (('source', self.source_frame), ('target', self.target_frame)):
+            if key not in config:
+                continue
+            
+            frame_config = config[key]
+            frame.db_type.set(frame_config.get('db_type', ''))
+            frame.on_db_type_changed()
+            
+            for var_name, field in frame.FIELDS:
+                getattr(frame, var_name).set(str(frame_config.get(field, '')))
     
     def validate_connections(self):
-        """Valida todas las conexiones configuradas"""
-        results = []
-        
-        # Validar origen
-        if self.source_frame.connection_config:
-            config = self.source_frame.connection_config
-            success, message = self.db_manager.test_connection(config['db_type'], config)
-            results.append(f"Origen: {'✓' if success else '✗'} {message}")
-        
-        # Validar destino
-        if self.target_frame.connection_config:
-            config = self.target_frame.connection_config
-            success, message = self.db_manager.test_connection(config['db_type'], config)
-            results.append(f"Destino: {'✓' if success else '✗'} {message}")
-        
-        if results:
-            messagebox.showinfo("Validación de Conexiones", "\n".join(results))
-        else:
+        """Valida todas las conexiones configuradas, probándolas en paralelo"""
+        jobs = [(label, frame.connection_config)
+                for label, frame in (("Origen", self.source_frame), ("Destino", self.target_frame))
+                if frame.connection_config]
+        
+        if not jobs:
             messagebox.showwarning("Validación", "No hay conexiones configuradas para validar")
+            return
+        
+        def validate_thread():
+            # El tiempo total es el de la prueba más lenta, no la suma de ambas
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                futures = [
+                    (label, executor.submit(self.db_manager.test_connection, config['db_type'], config))
+                    for label, config in jobs
+                ]
+            
+            results = []
+            for label, future in futures:
+                try:
+                    success, message = future.result()
+                except Exception as e:
+                    success, message = False, str(e)
+                results.append(f"{label}: {'✓' if success else '✗'} {message}")
+            
+            self.root.after(0, messagebox.showinfo, "Validación de Conexiones", "\n".join(results))
+        
+        threading.Thread(target=validate_thread, daemon=True).start()
     
     def clear_cache(self):
         """Limpia el cache y conexiones"""
         self.db_manager.close_all_connections()
         self.source_schema_info = None
+        
+        # Borrar los análisis guardados para forzar una nueva introspección
+        for path in self.SCHEMA_CACHE_DIR.glob('*.*'):
+            try:
+                path.unlink()
+            except OSError as e:
+                logging.getLogger(__name__).warning(f"No se pudo borrar {path}: {e}")
         messagebox.showinfo("Cache", "Cache limpiado correctamente")
     
     def show_about(self):
         """Muestra información sobre la aplicación"""
-        messagebox.showinfo("Acerca de", 
-                          "Pasador de Esquemas de BD v1.0\n\n"
-                          "Herramienta para transferir esquemas entre bases de datos\n"
-                          "con análisis automático de dependencias.\n\n"
-                          "Soporta: PostgreSQL, MySQL, SQL Server, Oracle, SQLite")
+        messagebox.showinfo("Acerca de", _about_text())
     
     def load_oracle_config(self):
-        """Carga rápidamente la configuración Oracle predefinida"""
+        """Carga rápidamente la configuración Oracle predefinida
+        
+        Si el archivo cambió desde la última lectura se parsea en un hilo de
+        trabajo; si no, se reutiliza el resultado cacheado sin salir del hilo de Tk.
+        """
         try:
-            config_file = Path(__file__).parent / "config" / "oracle_config.json"
+            config_file = _oracle_config_path()
             
             if not config_file.exists():
                 messagebox.showerror("Error", f"Archivo de configuración no encontrado:\n{config_file}")
                 return
             
-            with open(config_file, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-            
-            if 'connections' in config:
-                connections = config['connections']
-                
-                # Buscar conexiones Oracle
-                oracle_connections = {k: v for k, v in connections.items() 
-                                    if v.get('type', '').lower() == 'oracle'}
-                
-                if len(oracle_connections) >= 2:
-                    conn_keys = list(oracle_connections.keys())
-                    
-                    # Cargar primera como origen
-                    self.load_connection_to_frame(self.source_frame, oracle_connections[conn_keys[0]])
-                    
-                    # Cargar segunda como destino
-                    self.load_connection_to_frame(self.target_frame, oracle_connections[conn_keys[1]])
-                    
-                    messagebox.showinfo("Éxito", 
-                                      f"Configuración Oracle cargada:\n"
-                                      f"Origen: {oracle_connections[conn_keys[0]].get('name')}\n"
-                                      f"Destino: {oracle_connections[conn_keys[1]].get('name')}")
-                else:
-                    messagebox.showwarning("Advertencia", 
-                                         "Se necesitan al menos 2 conexiones Oracle en la configuración")
-            else:
-                messagebox.showerror("Error", "Formato de configuración no válido")
-                
-        except Exception as e:
+            key = (str(config_file), config_file.stat().st_mtime_ns)
+        except OSError as e:
             messagebox.showerror("Error", f"Error cargando configuración Oracle: {str(e)}")
+            return
+        
+        if key in self._oracle_cfg_cache:
+            self._apply_oracle_config(key, self._oracle_cfg_cache[key], None)
+            return
+        
+        def read_thread():
+            try:
+                oracle_connections, error = self._read_oracle_config_sync(config_file), None
+            except Exception as e:
+                oracle_connections, error = None, e
+            self.root.after(0, self._apply_oracle_config, key, oracle_connections, error)
+        
+        threading.Thread(target=read_thread, daemon=True).start()
+    
+    def _read_oracle_config_sync(self, config_file: Path) -> Optional[Dict[str, Dict]]:
+        """Lee y filtra las conexiones Oracle del archivo (sin tocar widgets, apto para hilos)
+        
+        Retorna None si el archivo no tiene la clave 'connections'.
+        """
+        with open(config_file, 'rb') as f:
+            data = f.read()
+        config = orjson.loads(data) if orjson is not None else json.loads(data)
+        
+        if 'connections' not in config:
+            return None
+        return {k: v for k, v in config['connections'].items()
+                if v.get('type', '').lower() == 'oracle'}
+    
+    def _apply_oracle_config(self, key: tuple, oracle_connections: Optional[Dict[str, Dict]],
+                             error: Optional[Exception]):
+        """Carga en los frames las conexiones Oracle leídas"""
+        if error is not None:
+            messagebox.showerror("Error", f"Error cargando configuración Oracle: {str(error)}")
+            return
+        
+        # Solo interesa la versión vigente del archivo
+        if key not in self._oracle_cfg_cache:
+            self._oracle_cfg_cache.clear()
+            self._oracle_cfg_cache[key] = oracle_connections
+        
+        if oracle_connections is None:
+            messagebox.showerror("Error", "Formato de configuración no válido")
+            return
+        
+        if len(oracle_connections) < 2:
+            messagebox.showwarning("Advertencia", 
+                                 "Se necesitan al menos 2 conexiones Oracle en la configuración")
+            return
+        
+        conn_keys = list(oracle_connections.keys())
+        
+        # Cargar primera como origen
+        self.load_connection_to_frame(self.source_frame, oracle_connections[conn_keys[0]])
+        
+        # Cargar segunda como destino
+        self.load_connection_to_frame(self.target_frame, oracle_connections[conn_keys[1]])
+        
+        messagebox.showinfo("Éxito", 
+                          f"Configuración Oracle cargada:\n"
+                          f"Origen: {oracle_connections[conn_keys[0]].get('name')}\n"
+                          f"Destino: {oracle_connections[conn_keys[1]].get('name')}")
+    
     def show_export_dialog(self):
-        """Muestra el diálogo de opciones de exportar"""
+        """Muestra el diálogo de opciones de exportar
+        
+        El diálogo se construye una sola vez; al cerrarlo se oculta y las
+        siguientes aperturas solo actualizan los datos del esquema.
+        """
         if not self.source_schema_info:
             messagebox.showerror("Error", "Primero analiza un esquema")
             return
         
-        # Crear ventana de diálogo
+        if self._export_dialog is None or not self._export_dialog.winfo_exists():
+            self._build_export_dialog()
+        else:
+            self._export_dialog.deiconify()
+            self._export_dialog.lift()
+        
+        # Datos del esquema actual
+        self._export_title_label.config(text=f"Exportar Esquema: {self.source_schema_info.schema_name}")
+        self._export_stats_label.config(text=self.source_schema_info.stats_text)
+        self._export_dialog.config(cursor="")
+        self._export_dialog.grab_set()
+    
+    def _build_export_dialog(self):
+        """Crea los widgets del diálogo de exportar"""
         dialog = tk.Toplevel(self.root)
         dialog.title("Exportar Esquema")
-        dialog.geometry("500x400")
+        
+        # Tamaño y posición (junto a la ventana principal) en una sola llamada
+        dialog.geometry("500x400+%d+%d" % (self.root.winfo_rootx() + 50, self.root.winfo_rooty() + 50))
         dialog.transient(self.root)
-        dialog.grab_set()
         
-        # Centrar ventana
-        dialog.geometry("+%d+%d" % (self.root.winfo_rootx() + 50, self.root.winfo_rooty() + 50))
+        # Cerrar solo oculta el diálogo para reutilizarlo
+        dialog.protocol("WM_DELETE_WINDOW", self._hide_export_dialog)
         
         # Frame principal
         main_frame = ttk.Frame(dialog, padding="20")
         main_frame.pack(fill='both', expand=True)
         
         # Título
-        ttk.Label(main_frame, text=f"Exportar Esquema: {self.source_schema_info.schema_name}", 
-                 font=('Arial', 12, 'bold')).pack(pady=(0, 20))
+        self._export_title_label = ttk.Label(main_frame, font=('Arial', 12, 'bold'))
+        self._export_title_label.pack(pady=(0, 20))
         
         # Opciones de exportación
         export_frame = ttk.LabelFrame(main_frame, text="Formato de Exportación", padding="10")
         export_frame.pack(fill='x', pady=(0, 20))
         
+        # Las variables se conservan entre aperturas: recuerdan la última elección
         export_var = tk.StringVar(value="sql")
         
-        ttk.Radiobutton(export_frame, text="📄 SQL DDL (Crear scripts de estructura)", 
-                       variable=export_var, value="sql").pack(anchor='w', pady=2)
-        ttk.Radiobutton(export_frame, text="📋 JSON (Metadatos completos)", 
-                       variable=export_var, value="json").pack(anchor='w', pady=2)
-        ttk.Radiobutton(export_frame, text="🌐 HTML (Reporte visual)", 
-                       variable=export_var, value="html").pack(anchor='w', pady=2)
-        ttk.Radiobutton(export_frame, text="📊 CSV (Resúmenes por tipo)", 
-                       variable=export_var, value="csv").pack(anchor='w', pady=2)
+        for text, value in self.EXPORT_OPTIONS:
+            ttk.Radiobutton(export_frame, text=text, variable=export_var, value=value).pack(anchor='w', pady=2)
         
         # Opciones adicionales para SQL
         sql_frame = ttk.LabelFrame(main_frame, text="Opciones para SQL DDL", padding="10")
@@ -1545,22 +2251,15 @@ Descripción: {conn.get('description', 'N/A')}"""
         db_frame = ttk.Frame(sql_frame)
         db_frame.pack(fill='x', pady=(5, 0))
         
-        ttk.Radiobutton(db_frame, text="Oracle", variable=target_db_var, value="oracle").pack(side='left', padx=(0, 10))
-        ttk.Radiobutton(db_frame, text="PostgreSQL", variable=target_db_var, value="postgresql").pack(side='left', padx=(0, 10))
-        ttk.Radiobutton(db_frame, text="SQL Server", variable=target_db_var, value="sqlserver").pack(side='left')
+        for text, value in self.DB_OPTIONS:
+            ttk.Radiobutton(db_frame, text=text, variable=target_db_var, value=value).pack(side='left', padx=(0, 10))
         
         # Información del esquema
         info_frame = ttk.LabelFrame(main_frame, text="Información del Esquema", padding="10")
         info_frame.pack(fill='x', pady=(0, 20))
         
-        stats_text = f"""📊 Tablas: {len(self.source_schema_info.objects.tables)}
-👁 Vistas: {len(self.source_schema_info.objects.views)}
-🔢 Secuencias: {len(self.source_schema_info.objects.sequences)}
-⚙️ Procedimientos: {len(self.source_schema_info.objects.procedures)}
-🎯 Triggers: {len(self.source_schema_info.objects.triggers)}
-📇 Índices: {len(self.source_schema_info.objects.indexes)}"""
-        
-        ttk.Label(info_frame, text=stats_text, justify='left').pack(anchor='w')
+        self._export_stats_label = ttk.Label(info_frame, justify='left')
+        self._export_stats_label.pack(anchor='w')
         
         # Botones
         button_frame = ttk.Frame(main_frame)
@@ -1570,59 +2269,33 @@ Descripción: {conn.get('description', 'N/A')}"""
             export_type = export_var.get()
             target_db = target_db_var.get()
             
-            # Seleccionar archivo de destino
-            if export_type == "sql":
-                filename = filedialog.asksaveasfilename(
-                    title="Guardar DDL SQL",
-                    defaultextension=".sql",
-                    filetypes=[("SQL files", "*.sql"), ("All files", "*.*")]
-                )
-            elif export_type == "json":
-                filename = filedialog.asksaveasfilename(
-                    title="Guardar JSON",
-                    defaultextension=".json",
-                    filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
-                )
-            elif export_type == "html":
-                filename = filedialog.asksaveasfilename(
-                    title="Guardar Reporte HTML",
-                    defaultextension=".html",
-                    filetypes=[("HTML files", "*.html"), ("All files", "*.*")]
-                )
-            elif export_type == "csv":
-                filename = filedialog.askdirectory(
-                    title="Seleccionar directorio para CSVs"
-                )
+            # Seleccionar archivo (o directorio) de destino
+            dialog_name, dialog_options, _, _ = self.EXPORT_SPECS[export_type]
+            filename = getattr(filedialog, dialog_name)(**dialog_options)
             
             if filename:
                 self.perform_export(export_type, filename, target_db, dialog)
         
         ttk.Button(button_frame, text="Exportar", command=do_export).pack(side='right', padx=(10, 0))
-        ttk.Button(button_frame, text="Cancelar", command=dialog.destroy).pack(side='right')
+        ttk.Button(button_frame, text="Cancelar", command=self._hide_export_dialog).pack(side='right')
+        
+        self._export_dialog = dialog
+    
+    def _hide_export_dialog(self):
+        """Oculta el diálogo de exportar sin destruirlo"""
+        self._export_dialog.grab_release()
+        self._export_dialog.withdraw()
     
     def perform_export(self, export_type: str, filename: str, target_db: str, dialog: tk.Toplevel):
         """Realiza la exportación en un hilo separado"""
         
         def export_thread():
             try:
-                success = False
+                _, _, method_name, uses_target_db = self.EXPORT_SPECS[export_type]
+                extra_args = (target_db,) if uses_target_db else ()
                 
-                if export_type == "sql":
-                    success = self.schema_exporter.export_to_sql_ddl(
-                        self.source_schema_info, filename, target_db
-                    )
-                elif export_type == "json":
-                    success = self.schema_exporter.export_to_json(
-                        self.source_schema_info, filename
-                    )
-                elif export_type == "html":
-                    success = self.schema_exporter.export_to_html_report(
-                        self.source_schema_info, filename
-                    )
-                elif export_type == "csv":
-                    success = self.schema_exporter.export_to_csv_summary(
-                        self.source_schema_info, filename
-                    )
+                export_method = getattr(self.schema_exporter, method_name)
+                success = export_method(self.source_schema_info, filename, *extra_args)
                 
                 # Notificar resultado en el hilo principal
                 self.root.after(0, lambda: self.on_export_complete(success, filename, dialog))
@@ -1631,14 +2304,11 @@ Descripción: {conn.get('description', 'N/A')}"""
                 error_msg = f"Error durante la exportación: {str(e)}"
                 self.root.after(0, lambda: self.on_export_error(error_msg, dialog))
         
-        # Cambiar cursor y deshabilitar botones
-        try:
-            dialog.config(cursor="watch")  # Usar "watch" en lugar de "wait"
-        except:
-            pass  # Ignorar si el cursor no es compatible
+        # Cambiar cursor ("watch" existe en todas las plataformas, a diferencia de "wait")
+        dialog.config(cursor="watch")
         
-        # Ejecutar en hilo separado
-        threading.Thread(target=export_thread, daemon=True).start()
+        # Ejecutar en el hilo de exportación
+        self._export_pool.submit(export_thread)
     
     def on_export_complete(self, success: bool, filename: str, dialog: tk.Toplevel):
         """Maneja la finalización de la exportación"""
@@ -1647,7 +2317,8 @@ Descripción: {conn.get('description', 'N/A')}"""
         if success:
             messagebox.showinfo("Exportación Completa", 
                               f"Esquema exportado exitosamente a:\n{filename}")
-            dialog.destroy()
+            # Ocultar en lugar de destruir: se reutiliza en la próxima exportación
+            self._hide_export_dialog()
         else:
             messagebox.showerror("Error de Exportación", 
                                "Hubo un problema durante la exportación. Revisa los logs.")
@@ -1663,6 +2334,7 @@ Descripción: {conn.get('description', 'N/A')}"""
             self.root.mainloop()
         finally:
             # Limpiar recursos
+            self._export_pool.shutdown(wait=False)
             self.db_manager.close_all_connections()
 
 
@@ -11,6 +11,28 @@ import logging
 ctk.set_appearance_mode("system")
 ctk.set_default_color_theme("blue")
 
+# Textos de los diálogos informativos
+_DEMO_TEXT = (
+    "Esta es una demostración de CustomTkinter funcionando!\n\n"
+    "La interfaz moderna está lista para:\n"
+    "• Conectar a bases de datos\n"
+    "• Analizar esquemas completos\n"
+    "• Exportar documentación\n"
+    "• Transferir datos inteligentemente"
+)
+
+_ABOUT_TEXT = """🚀 Pasador de Esquemas de BD
+
+Versión: 2.0 - Moderna
+Framework: CustomTkinter
+
+Una herramienta profesional para migración
+de esquemas entre bases de datos con
+interfaz moderna y funcionalidades avanzadas.
+
+✨ Desarrollado con tecnología moderna para
+proporcionar la mejor experiencia de usuario."""
+
 
 class BasicModernGUI:
     """GUI moderna básica sin funcionalidades complejas"""
@@ -111,48 +133,24 @@ de la aplicación de migración de esquemas."""
             width=150
         )
         about_btn.pack(side='left', padx=10, pady=10)
-        
-        # Estado del tema
-        self.is_dark = False
     
     def show_demo(self):
         """Muestra demostración"""
-        messagebox.showinfo(
-            "🎯 Demostración",
-            "Esta es una demostración de CustomTkinter funcionando!\n\n"
-            "La interfaz moderna está lista para:\n"
-            "• Conectar a bases de datos\n"
-            "• Analizar esquemas completos\n"
-            "• Exportar documentación\n"
-            "• Transferir datos inteligentemente"
-        )
+        messagebox.showinfo("🎯 Demostración", _DEMO_TEXT)
     
     def toggle_theme(self):
         """Cambia entre tema claro y oscuro"""
-        if self.is_dark:
+        # get_appearance_mode() ya resuelve "system" al modo efectivo
+        if ctk.get_appearance_mode().lower() == "dark":
             ctk.set_appearance_mode("light")
-            self.is_dark = False
             messagebox.showinfo("🌞", "Tema claro activado")
         else:
             ctk.set_appearance_mode("dark")
-            self.is_dark = True
             messagebox.showinfo("🌙", "Tema oscuro activado")
     
     def show_about(self):
         """Muestra información sobre la aplicación"""
-        about_text = """🚀 Pasador de Esquemas de BD
-
-Versión: 2.0 - Moderna
-Framework: CustomTkinter
-
-Una herramienta profesional para migración
-de esquemas entre bases de datos con
-interfaz moderna y funcionalidades avanzadas.
-
-✨ Desarrollado con tecnología moderna para
-proporcionar la mejor experiencia de usuario."""
-        
-        messagebox.showinfo("ℹ️ Acerca de", about_text)
+        messagebox.showinfo("ℹ️ Acerca de", _ABOUT_TEXT)
     
     def run(self):
         """Ejecuta la aplicación"""
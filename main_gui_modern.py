@@ -4,35 +4,128 @@ Versión modernizada con apariencia profesional y temas dark/light
 """
 
 import customtkinter as ctk
-from tkinter import messagebox, filedialog
+from tkinter import messagebox, filedialog, ttk
 import tkinter as tk
 import logging
-import threading
-import json
-from typing import Dict, List, Optional, Any
-from datetime import datetime
 import os
-from pathlib import Path
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional
 
-from database_manager import DatabaseManager
-from schema_analyzer import SchemaAnalyzer, SchemaInfo
-from dependency_resolver import DependencyResolver
-from schema_exporter import SchemaExporter
+# Los módulos de negocio arrastran SQLAlchemy y los drivers de BD: se importan
+# al primer uso para que la ventana aparezca antes
+if TYPE_CHECKING:
+    from database_manager import DatabaseManager
+    from schema_analyzer import SchemaInfo
 
 # Configurar CustomTkinter
 ctk.set_appearance_mode("system")  # system, light, dark
 ctk.set_default_color_theme("blue")  # blue, green, dark-blue
 
+# Fuentes compartidas por todos los widgets: cada CTkFont crea una fuente Tk
+_FONTS: Dict[tuple, ctk.CTkFont] = {}
+
+
+def _font(size: int, weight: str = "normal") -> ctk.CTkFont:
+    """Obtiene (creándola la primera vez) la fuente del tamaño y peso indicados"""
+    key = (size, weight)
+    if key not in _FONTS:
+        _FONTS[key] = ctk.CTkFont(size=size, weight=weight)
+    return _FONTS[key]
+
+
+def _readonly_textbox(parent) -> ctk.CTkTextbox:
+    """Crea un textbox de solo lectura, sin pila de deshacer ni ajuste de líneas"""
+    textbox = ctk.CTkTextbox(parent, undo=False, autoseparators=False, maxundo=0, wrap="none")
+    textbox.configure(state="disabled")
+    return textbox
+
+
+def _set_text(textbox: ctk.CTkTextbox, text: str):
+    """Reemplaza el contenido de un textbox de solo lectura en una sola inserción"""
+    textbox.configure(state="normal")
+    textbox.delete("0.0", "end")
+    textbox.insert("0.0", text)
+    textbox.configure(state="disabled")
+
+
+# Textos de los diálogos informativos
+_ABOUT_TEXT = """🚀 Pasador de Esquemas de BD - Versión Moderna
+
+Una herramienta profesional para migración de esquemas de bases de datos
+con interfaz moderna usando CustomTkinter.
+
+✨ Características:
+• Interfaz moderna con temas dark/light
+• Soporte para múltiples tipos de BD
+• Análisis completo de dependencias
+• Exportación a múltiples formatos
+• Transferencia inteligente de datos
+
+🔧 Tecnologías:
+• Python 3.7+
+• CustomTkinter (GUI moderna)
+• SQLAlchemy (Abstracción de BD)
+• Pandas (Manipulación de datos)
+
+© 2025 - Herramienta de migración de esquemas"""
+
+# Avisos de las acciones aún no implementadas
+_WIP_TEXT = {
+    "select_tables": "Funcionalidad de selección de tablas\nserá implementada próximamente",
+    "start_transfer": "Funcionalidad de transferencia\nserá implementada próximamente",
+    "export": "Funcionalidad de exportación\nserá implementada próximamente"
+}
+
 
 class ModernConnectionFrame(ctk.CTkFrame):
     """Frame moderno para configuración de conexiones de BD"""
     
-    def __init__(self, parent, title: str, connection_type: str):
+    # Con más esquemas que el umbral se muestran por páginas (los CTkScrollableFrame
+    # no virtualizan y se vuelven lentos con miles de hijos)
+    SCHEMA_PAGE_THRESHOLD = 200
+    SCHEMA_PAGE_SIZE = 100
+    
+    # Duración de los avisos (ms); los de error quedan más tiempo para poder leerlos
+    TOAST_MS = 2500
+    TOAST_ERROR_MS = 6000
+    
+    # Campos de conexión por conjunto: archivo (SQLite) o servidor (resto)
+    FIELD_SETS = {
+        "sqlite": [("📁 Archivo de BD", "database")],
+        "server": [
+            ("🌐 Servidor", "host"),
+            ("🔌 Puerto", "port"),
+            ("🗄️ Base de Datos", "database"),
+            ("👤 Usuario", "user"),
+            ("🔒 Contraseña", "password")
+        ]
+    }
+    
+    # Valores por defecto
+    DEFAULT_VALUES = {
+        "oracle": {"host": "localhost", "port": "1521"},
+        "postgresql": {"host": "localhost", "port": "5432"},
+        "mysql": {"host": "localhost", "port": "3306"},
+        "sqlserver": {"host": "localhost", "port": "1433"}
+    }
+    
+    def __init__(self, parent, title: str, connection_type: str, executor: ThreadPoolExecutor,
+                 get_db_manager: Callable[[], "DatabaseManager"]):
         super().__init__(parent)
         
         self.connection_type = connection_type
         self.connection_config = {}
         
+        # DatabaseManager de la aplicación: sus engines (y pools) se reutilizan entre clics
+        self._get_db_manager = get_db_manager
+        
+        # Pool de hilos compartido de la aplicación para pruebas y conexiones
+        self.executor = executor
+        # Hay una prueba o conexión en curso (ignora clics repetidos)
+        self._inflight = False
+        # Restauraciones de botones programadas con after(), por botón
+        self._pending_restore = {}
+        
         # Título con icono
         title_frame = ctk.CTkFrame(self)
         title_frame.pack(fill='x', padx=10, pady=(10, 5))
@@ -41,7 +134,7 @@ class ModernConnectionFrame(ctk.CTkFrame):
         title_label = ctk.CTkLabel(
             title_frame, 
             text=f"{icon} {title}", 
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=_font(16, "bold")
         )
         title_label.pack(pady=10)
         
@@ -61,7 +154,7 @@ class ModernConnectionFrame(ctk.CTkFrame):
         ctk.CTkLabel(
             db_type_frame, 
             text="Tipo de Base de Datos:",
-            font=ctk.CTkFont(size=12, weight="bold")
+            font=_font(12, "bold")
         ).pack(anchor='w', padx=10, pady=(10, 5))
         
         self.db_type_var = ctk.StringVar(value="oracle")
@@ -98,7 +191,7 @@ class ModernConnectionFrame(ctk.CTkFrame):
         ctk.CTkLabel(
             fields_frame,
             text="Parámetros de Conexión:",
-            font=ctk.CTkFont(size=12, weight="bold")
+            font=_font(12, "bold")
         ).pack(anchor='w', padx=10, pady=(10, 5))
         
         # Grid para campos
@@ -106,7 +199,7 @@ class ModernConnectionFrame(ctk.CTkFrame):
         self.fields_container.pack(fill='x', padx=10, pady=(0, 10))
         
         # Crear campos de entrada modernos
-        self.create_connection_fields()
+        self._build_all_field_widgets()
         
         # Botones de acción
         buttons_frame = ctk.CTkFrame(parent)
@@ -117,7 +210,7 @@ class ModernConnectionFrame(ctk.CTkFrame):
             text="🔍 Probar Conexión",
             command=self.test_connection,
             height=35,
-            font=ctk.CTkFont(size=12, weight="bold")
+            font=_font(12, "bold")
         )
         self.test_btn.pack(side='left', padx=(10, 5), pady=10)
         
@@ -126,7 +219,7 @@ class ModernConnectionFrame(ctk.CTkFrame):
             text="🔗 Conectar",
             command=self.connect,
             height=35,
-            font=ctk.CTkFont(size=12, weight="bold")
+            font=_font(12, "bold")
         )
         self.connect_btn.pack(side='left', padx=5, pady=10)
         
@@ -137,7 +230,7 @@ class ModernConnectionFrame(ctk.CTkFrame):
         ctk.CTkLabel(
             schemas_frame,
             text="📋 Esquemas Disponibles:",
-            font=ctk.CTkFont(size=12, weight="bold")
+            font=_font(12, "bold")
         ).pack(anchor='w', padx=10, pady=(10, 5))
         
         # Scrollable frame para esquemas
@@ -147,85 +240,87 @@ class ModernConnectionFrame(ctk.CTkFrame):
         # Variable para esquema seleccionado
         self.selected_schema_var = ctk.StringVar()
         self.schema_buttons = []
-        
-    def create_connection_fields(self):
-        """Crea los campos de conexión modernos"""
-        
-        # Limpiar campos existentes
-        for widget in self.fields_container.winfo_children():
-            widget.destroy()
-        
-        self.entries = {}
-        
-        # Campos según el tipo de BD
-        db_type = self.db_type_var.get()
-        
-        if db_type == "sqlite":
-            fields = [("📁 Archivo de BD", "database", True)]
-        else:
-            fields = [
-                ("🌐 Servidor", "host", False),
-                ("🔌 Puerto", "port", False),
-                ("🗄️ Base de Datos", "database", False),
-                ("👤 Usuario", "user", False),
-                ("🔒 Contraseña", "password", True)
-            ]
-        
-        # Crear campos en grid
-        for i, (label_text, field_name, is_password) in enumerate(fields):
-            # Label
-            label = ctk.CTkLabel(
-                self.fields_container,
-                text=label_text,
-                font=ctk.CTkFont(size=11)
-            )
-            label.grid(row=i, column=0, sticky='w', padx=(10, 5), pady=5)
-            
-            # Entry
-            if is_password and field_name == "password":
-                entry = ctk.CTkEntry(
+        self._load_schemas_btn = None
+        self._more_schemas_btn = None
+        self._pending_schemas = []
+        
+    def _build_all_field_widgets(self):
+        """Crea una sola vez los campos de todos los tipos de BD
+        
+        Cada conjunto (archivo SQLite o servidor) queda en su propia fila del
+        grid; on_db_type_change solo oculta/muestra con grid_remove/grid.
+        """
+        self._field_rows = {}
+        self._field_entries = {}
+        
+        for field_set, fields in self.FIELD_SETS.items():
+            rows = []
+            entries = {}
+            for i, (label_text, field_name) in enumerate(fields):
+                # Label
+                label = ctk.CTkLabel(
                     self.fields_container,
-                    show="*",
-                    height=30
+                    text=label_text,
+                    font=_font(11)
                 )
-            elif field_name == "database" and db_type == "sqlite":
-                # Frame para SQLite con botón browse
-                sqlite_frame = ctk.CTkFrame(self.fields_container)
-                sqlite_frame.grid(row=i, column=1, sticky='ew', padx=5, pady=5)
+                label.grid(row=i, column=0, sticky='w', padx=(10, 5), pady=5)
                 
-                entry = ctk.CTkEntry(sqlite_frame, height=30)
-                entry.pack(side='left', fill='x', expand=True, padx=(0, 5))
+                # Entry
+                if field_set == "sqlite":
+                    # Frame para SQLite con botón browse
+                    cell = ctk.CTkFrame(self.fields_container)
+                    entry = ctk.CTkEntry(cell, height=30)
+                    entry.pack(side='left', fill='x', expand=True, padx=(0, 5))
+                    
+                    browse_btn = ctk.CTkButton(
+                        cell,
+                        text="📂",
+                        width=40,
+                        height=30,
+                        command=lambda e=entry: self.browse_sqlite_file(e)
+                    )
+                    browse_btn.pack(side='right')
+                else:
+                    entry = ctk.CTkEntry(
+                        self.fields_container,
+                        show="*" if field_name == "password" else "",
+                        height=30
+                    )
+                    cell = entry
+                cell.grid(row=i, column=1, sticky='ew', padx=5, pady=5)
                 
-                browse_btn = ctk.CTkButton(
-                    sqlite_frame,
-                    text="📂",
-                    width=40,
-                    height=30,
-                    command=lambda: self.browse_sqlite_file(entry)
-                )
-                browse_btn.pack(side='right')
-            else:
-                entry = ctk.CTkEntry(
-                    self.fields_container,
-                    height=30
-                )
-                entry.grid(row=i, column=1, sticky='ew', padx=5, pady=5)
-            
-            # Valores por defecto
-            default_values = {
-                "oracle": {"host": "localhost", "port": "1521"},
-                "postgresql": {"host": "localhost", "port": "5432"},
-                "mysql": {"host": "localhost", "port": "3306"},
-                "sqlserver": {"host": "localhost", "port": "1433"}
-            }
+                rows.extend((label, cell))
+                entries[field_name] = entry
             
-            if db_type in default_values and field_name in default_values[db_type]:
-                entry.insert(0, default_values[db_type][field_name])
-            
-            self.entries[field_name] = entry
+            self._field_rows[field_set] = rows
+            self._field_entries[field_set] = entries
         
         # Configurar grid weights
         self.fields_container.grid_columnconfigure(1, weight=1)
+        
+        self._show_connection_fields()
+    
+    def _show_connection_fields(self):
+        """Muestra los campos del tipo de BD elegido y aplica sus valores por defecto"""
+        db_type = self.db_type_var.get()
+        active = "sqlite" if db_type == "sqlite" else "server"
+        
+        for field_set, rows in self._field_rows.items():
+            for widget in rows:
+                if field_set == active:
+                    widget.grid()
+                else:
+                    widget.grid_remove()
+        
+        self.entries = self._field_entries[active]
+        
+        # Reemplazar el valor solo si está vacío o es el default de otro tipo
+        for field_name, default in self.DEFAULT_VALUES.get(db_type, {}).items():
+            entry = self.entries[field_name]
+            current = entry.get()
+            if not current or current in {values[field_name] for values in self.DEFAULT_VALUES.values()}:
+                entry.delete(0, 'end')
+                entry.insert(0, default)
     
     def browse_sqlite_file(self, entry):
         """Abre diálogo para seleccionar archivo SQLite"""
@@ -239,144 +334,270 @@ class ModernConnectionFrame(ctk.CTkFrame):
     
     def on_db_type_change(self):
         """Maneja cambio de tipo de BD"""
-        self.create_connection_fields()
+        self._show_connection_fields()
     
     def test_connection(self):
         """Prueba la conexión a la BD"""
+        if self._inflight:
+            return
+        
         try:
             config = self.get_connection_config()
             if not config:
                 return
             
             # Cambiar botón mientras prueba
-            self.test_btn.configure(text="⏳ Probando...", state="disabled")
+            self._set_btn(self.test_btn, "⏳ Probando...", state="disabled")
             
             def test_thread():
-                try:
-                    from database_manager import DatabaseManager
-                    db_manager = DatabaseManager()
-                    engine = db_manager.get_engine("test", config['db_type'], config)
-                    
-                    # Probar conexión
-                    with engine.connect() as conn:
-                        from sqlalchemy import text
-                        conn.execute(text("SELECT 1"))
-                    
-                    # Actualizar UI en hilo principal
-                    self.after(0, lambda: self.on_test_success())
-                    
-                except Exception as e:
-                    self.after(0, lambda: self.on_test_error(str(e)))
+                engine = self._get_engine(f"test_{self.connection_type}", config)
+                
+                # Probar conexión
+                with engine.connect() as conn:
+                    conn.exec_driver_sql("SELECT 1")
             
-            threading.Thread(target=test_thread, daemon=True).start()
+            self._set_inflight(True)
+            future = self.executor.submit(test_thread)
+            # Actualizar UI en hilo principal
+            future.add_done_callback(lambda f: self.after(0, self._on_test_done, f))
             
         except Exception as e:
             self.on_test_error(str(e))
     
+    def _get_engine(self, connection_id: str, config: Dict):
+        """Obtiene el engine compartido (DatabaseManager lo recrea si cambió la configuración)"""
+        return self._get_db_manager().get_engine(connection_id, config['db_type'], config)
+    
+    def get_engine(self, config: Dict):
+        """Engine de la conexión de este frame, reutilizado mientras la configuración no cambie"""
+        return self._get_engine(self.connection_type, config)
+    
+    def _on_test_done(self, future: Future):
+        """Despacha el resultado de la prueba de conexión"""
+        self._set_inflight(False)
+        error = future.exception()
+        if error is None:
+            self.on_test_success()
+        else:
+            self.on_test_error(str(error))
+    
     def on_test_success(self):
         """Maneja prueba de conexión exitosa"""
-        self.test_btn.configure(text="✅ Conexión OK", fg_color="green")
-        
-        # Restaurar botón después de un delay
-        def restore_button():
-            self.test_btn.configure(
-                text="🔍 Probar Conexión", 
-                state="normal",
-                fg_color=None  # Usar color por defecto
-            )
-        
-        self.after(2000, restore_button)
-        messagebox.showinfo("Conexión Exitosa", "La conexión se estableció correctamente")
+        self._set_btn(self.test_btn, "✅ Conexión OK", "green", revert="🔍 Probar Conexión")
+        self._show_toast("Conexión Exitosa", "La conexión se estableció correctamente", "green",
+                         anchor=self.test_btn)
     
     def on_test_error(self, error):
         """Maneja error en prueba de conexión"""
-        self.test_btn.configure(text="❌ Error", fg_color="red", state="normal")
-        
-        # Restaurar botón después de un delay
-        def restore_button():
-            self.test_btn.configure(
-                text="🔍 Probar Conexión",
-                fg_color=None  # Usar color por defecto
-            )
-        
-        self.after(2000, restore_button)
-        messagebox.showerror("Error de Conexión", f"No se pudo conectar:\n{error}")
+        self._set_btn(self.test_btn, "❌ Error", "red", revert="🔍 Probar Conexión")
+        self._show_toast("Error de Conexión", f"No se pudo conectar:\n{error}", "red",
+                         anchor=self.test_btn, duration=self.TOAST_ERROR_MS)
     
     def connect(self):
-        """Establece conexión y carga esquemas"""
+        """Prepara la conexión; los esquemas se cargan a demanda
+        
+        El engine de SQLAlchemy no abre ninguna conexión hasta la primera
+        consulta, así que aquí no hay acceso a red: la enumeración de esquemas
+        (costosa en Oracle/SQL Server) espera al botón "Cargar esquemas".
+        """
+        if self._inflight:
+            return
+        
         try:
             config = self.get_connection_config()
             if not config:
                 return
             
             self.connection_config = config
-            
-            # Cambiar botón mientras conecta
-            self.connect_btn.configure(text="⏳ Conectando...", state="disabled")
-            
-            def connect_thread():
-                try:
-                    from database_manager import DatabaseManager
-                    db_manager = DatabaseManager()
-                    engine = db_manager.get_engine(self.connection_type, config['db_type'], config)
-                    
-                    # Obtener esquemas
-                    schemas = db_manager.get_schemas(engine, config['db_type'])
-                    
-                    # Actualizar UI en hilo principal
-                    self.after(0, lambda: self.on_connect_success(schemas))
-                    
-                except Exception as e:
-                    self.after(0, lambda: self.on_connect_error(str(e)))
-            
-            threading.Thread(target=connect_thread, daemon=True).start()
+            self._get_engine(self.connection_type, config)
             
         except Exception as e:
             self.on_connect_error(str(e))
+            return
+        
+        self._clear_schema_buttons()
+        self._load_schemas_btn = ctk.CTkButton(
+            self.schemas_scroll,
+            text="🔄 Cargar esquemas",
+            command=self._load_schemas_async,
+            font=_font(11)
+        )
+        self._load_schemas_btn.pack(padx=10, pady=10)
+        self.schema_buttons.append(self._load_schemas_btn)
     
-    def on_connect_success(self, schemas):
-        """Maneja conexión exitosa y carga esquemas"""
-        self.connect_btn.configure(text="✅ Conectado", fg_color="green", state="normal")
+    def _load_schemas_async(self):
+        """Obtiene los esquemas de la conexión en el pool de hilos"""
+        if self._inflight:
+            return
         
-        # Limpiar esquemas anteriores
+        config = self.connection_config
+        
+        # Cambiar botones mientras conecta
+        self._set_btn(self.connect_btn, "⏳ Conectando...", state="disabled")
+        self._load_schemas_btn.configure(text="⏳ Cargando...", state="disabled")
+        
+        def connect_thread():
+            engine = self._get_engine(self.connection_type, config)
+            
+            # Obtener esquemas
+            return self._get_db_manager().get_schemas(engine, config['db_type'])
+        
+        self._set_inflight(True)
+        future = self.executor.submit(connect_thread)
+        # Actualizar UI en hilo principal
+        future.add_done_callback(lambda f: self.after(0, self._on_connect_done, f))
+    
+    def _on_connect_done(self, future: Future):
+        """Despacha el resultado de la conexión"""
+        self._set_inflight(False)
+        error = future.exception()
+        if error is None:
+            self.on_connect_success(future.result())
+        else:
+            if self._load_schemas_btn is not None:
+                self._load_schemas_btn.configure(text="🔄 Cargar esquemas", state="normal")
+            self.on_connect_error(str(error))
+    
+    def _clear_schema_buttons(self):
+        """Elimina los widgets de la lista de esquemas"""
         for btn in self.schema_buttons:
             btn.destroy()
         self.schema_buttons.clear()
+        self._load_schemas_btn = None
+        self._more_schemas_btn = None
+        self._pending_schemas = []
+    
+    def on_connect_success(self, schemas):
+        """Maneja conexión exitosa y carga esquemas"""
+        self._set_btn(self.connect_btn, "✅ Conectado", "green")
+        
+        # Limpiar esquemas anteriores
+        self._clear_schema_buttons()
         
         # Agregar nuevos esquemas como botones radio modernos
-        if schemas:
-            for schema in sorted(schemas):
-                btn = ctk.CTkRadioButton(
-                    self.schemas_scroll,
-                    text=f"📋 {schema}",
-                    variable=self.selected_schema_var,
-                    value=schema,
-                    font=ctk.CTkFont(size=11)
-                )
-                btn.pack(anchor='w', padx=10, pady=2)
-                self.schema_buttons.append(btn)
+        # Ordenar una sola vez por conexión
+        self._pending_schemas = sorted(schemas) if schemas else []
+        
+        if self._pending_schemas:
+            self._show_more_schemas()
         else:
             no_schemas_label = ctk.CTkLabel(
                 self.schemas_scroll,
                 text="❌ No se encontraron esquemas accesibles",
-                font=ctk.CTkFont(size=11),
+                font=_font(11),
                 text_color="gray"
             )
             no_schemas_label.pack(padx=10, pady=10)
+            self.schema_buttons.append(no_schemas_label)
     
-    def on_connect_error(self, error):
-        """Maneja error de conexión"""
-        self.connect_btn.configure(text="❌ Error", fg_color="red", state="normal")
-        
-        # Restaurar botón después de un delay
-        def restore_button():
-            self.connect_btn.configure(
-                text="🔗 Conectar",
-                fg_color=None  # Usar color por defecto
+    def _show_more_schemas(self):
+        """Agrega a la lista la siguiente página de esquemas pendientes"""
+        if self._more_schemas_btn is not None:
+            self.schema_buttons.remove(self._more_schemas_btn)
+            self._more_schemas_btn.destroy()
+            self._more_schemas_btn = None
+        
+        pending = self._pending_schemas
+        count = len(pending) if len(pending) <= self.SCHEMA_PAGE_THRESHOLD else self.SCHEMA_PAGE_SIZE
+        page, self._pending_schemas = pending[:count], pending[count:]
+        
+        # Crear todos los botones y recién después empaquetarlos
+        buttons = [
+            ctk.CTkRadioButton(
+                self.schemas_scroll,
+                text=f"📋 {schema}",
+                variable=self.selected_schema_var,
+                value=schema,
+                font=_font(11)
             )
+            for schema in page
+        ]
+        for btn in buttons:
+            btn.pack(anchor='w', padx=10, pady=2)
+        self.schema_buttons.extend(buttons)
         
-        self.after(3000, restore_button)
-        messagebox.showerror("Error de Conexión", f"No se pudo conectar:\n{error}")
+        if self._pending_schemas:
+            self._more_schemas_btn = ctk.CTkButton(
+                self.schemas_scroll,
+                text=f"⬇️ Ver más ({len(self._pending_schemas)} restantes)",
+                command=self._show_more_schemas,
+                font=_font(11)
+            )
+            self._more_schemas_btn.pack(padx=10, pady=10)
+            self.schema_buttons.append(self._more_schemas_btn)
+    
+    def on_connect_error(self, error):
+        """Maneja error de conexión"""
+        self._set_btn(self.connect_btn, "❌ Error", "red", revert="🔗 Conectar", delay=3000)
+        self._show_toast("Error de Conexión", f"No se pudo conectar:\n{error}", "red",
+                         anchor=self.connect_btn, duration=self.TOAST_ERROR_MS)
+    
+    def _set_inflight(self, busy: bool):
+        """Marca si hay una prueba o carga en curso
+        
+        Mientras dura se deshabilitan los tres botones de acción: comparten
+        el engine, así que solo se permite una operación a la vez.
+        """
+        self._inflight = busy
+        state = "disabled" if busy else "normal"
+        for btn in (self.test_btn, self.connect_btn, self._load_schemas_btn):
+            if btn is not None:
+                btn.configure(state=state)
+    
+    def _set_btn(self, btn, text: str, fg: Optional[str] = None, state: str = "normal",
+                 revert: Optional[str] = None, delay: int = 2000):
+        """Cambia texto/color/estado de un botón
+        
+        Cancela la restauración pendiente del botón, así los clics repetidos
+        no acumulan callbacks. Con revert programa volver a ese texto y al
+        color por defecto tras delay ms.
+        """
+        after_id = self._pending_restore.pop(btn, None)
+        if after_id is not None:
+            self.after_cancel(after_id)
+        
+        btn.configure(text=text, fg_color=fg or ctk.ThemeManager.theme["CTkButton"]["fg_color"], state=state)
+        if revert is not None:
+            self._pending_restore[btn] = self.after(delay, self._revert_btn, btn, revert)
+    
+    def _revert_btn(self, btn, text: str):
+        """Restaura un botón, sin habilitarlo si hay otra operación en curso"""
+        self._set_btn(btn, text, state="disabled" if self._inflight else "normal")
+    
+    def _show_toast(self, title: str, message: str, color: str, anchor=None,
+                    duration: Optional[int] = None):
+        """Muestra un aviso no modal que se cierra solo (o con un clic)
+        
+        A diferencia de messagebox no anida un event loop, así que los hilos
+        que terminan mientras está visible pueden actualizar la interfaz.
+        """
+        toast = ctk.CTkToplevel(self)
+        toast.overrideredirect(True)
+        toast.attributes("-topmost", True)
+        
+        frame = ctk.CTkFrame(toast, fg_color=color, corner_radius=8)
+        frame.pack(fill='both', expand=True)
+        
+        title_label = ctk.CTkLabel(frame, text=title, font=_font(12, "bold"), text_color="white")
+        title_label.pack(anchor='w', padx=12, pady=(8, 0))
+        message_label = ctk.CTkLabel(frame, text=message, font=_font(11), text_color="white",
+                                     justify="left", wraplength=320)
+        message_label.pack(anchor='w', padx=12, pady=(0, 8))
+        
+        # Debajo del botón que originó el aviso
+        anchor = anchor or self
+        toast.geometry(f"+{anchor.winfo_rootx()}+{anchor.winfo_rooty() + anchor.winfo_height() + 5}")
+        
+        # El cierre automático se cancela si se cierra antes con un clic
+        # (si no, el after quedaría apuntando a un comando Tcl ya borrado)
+        after_id = toast.after(duration or self.TOAST_MS, toast.destroy)
+        
+        def close(event=None):
+            toast.after_cancel(after_id)
+            toast.destroy()
+        
+        for widget in (toast, frame, title_label, message_label):
+            widget.bind("<Button-1>", close)
     
     def get_connection_config(self) -> Optional[Dict]:
         """Obtiene configuración de conexión desde el formulario"""
@@ -401,17 +622,97 @@ class ModernConnectionFrame(ctk.CTkFrame):
 class ModernSchemaVisualizationFrame(ctk.CTkFrame):
     """Frame moderno para visualización de esquemas"""
     
-    def __init__(self, parent):
+    # Pestaña -> método que la actualiza
+    TAB_UPDATERS = {
+        "📈 Resumen": "update_summary_tab",
+        "🔗 Dependencias": "update_dependencies_tab",
+        "📋 Orden": "update_order_tab",
+        "🗂️ Objetos": "update_objects_tab",
+        "⚠️ Problemas": "update_problems_tab"
+    }
+    
+    # Pestañas que solo se actualizan al visitarlas
+    LAZY_TABS = ("🗂️ Objetos",)
+    
+    # Prefijos de índices creados automáticamente por el motor
+    SYSTEM_INDEX_PREFIXES = ('PK_', 'FK_', 'SYS_')
+    
+    # Listas de la pestaña Objetos: (atributo de SchemaObjects, título,
+    # formato de cada objeto, método que indica si se omite)
+    OBJECT_RENDERERS = (
+        ("tables", "📊 TABLAS", lambda name, table: (
+            f"📋 {name}\n"
+            f"   📊 Filas: {table.row_count:,}\n"
+            f"   📄 Columnas: {len(table.columns)}\n"
+            f"   🔗 FKs: {len(table.foreign_keys)}\n"
+            f"   📚 Deps: {len(table.dependencies)}\n\n"), None),
+        ("views", "👁 VISTAS", lambda name, view: (
+            f"👁 {name}\n"
+            f"   ✏️  Actualizable: {'Sí' if view.is_updatable else 'No'}\n"
+            f"   📄 Columnas: {len(view.columns)}\n"
+            f"   📚 Deps: {len(view.dependencies)}\n\n"), None),
+        ("sequences", "🔢 SECUENCIAS", lambda name, seq: (
+            f"🔢 {name}\n"
+            f"   🎯 Inicio: {seq.start_value}\n"
+            f"   ⬆️  Incremento: {seq.increment_by}\n"
+            f"   🔄 Ciclo: {'Sí' if seq.cycle_flag else 'No'}\n\n"), None),
+        ("procedures", "⚙️ PROCEDIMIENTOS", lambda name, proc: (
+            f"⚙️ {name}\n"
+            f"   🏷️  Tipo: {proc.procedure_type}\n"
+            f"   🗣️  Lenguaje: {proc.language}\n"
+            f"   📋 Parámetros: {len(proc.parameters)}\n\n"), None),
+        ("triggers", "🎯 TRIGGERS", lambda name, trigger: (
+            f"🎯 {name}\n"
+            f"   📋 Tabla: {trigger.table_name}\n"
+            f"   🏷️  Tipo: {trigger.trigger_type}\n"
+            f"   ⚡ Evento: {trigger.triggering_event}\n"
+            f"   🔘 Estado: {trigger.status}\n\n"), None),
+        ("indexes", "📇 ÍNDICES", lambda name, index: (
+            f"📇 {name}\n"
+            f"   📋 Tabla: {index.table_name}\n"
+            f"   🏷️  Tipo: {index.index_type}\n"
+            f"   🔒 Único: {'Sí' if index.is_unique else 'No'}\n"
+            f"   📄 Columnas: {', '.join(index.columns)}\n\n"), "_is_system_index"),
+    )
+    
+    def __init__(self, parent, executor: ThreadPoolExecutor):
         super().__init__(parent)
         
         self.schema_info = None
+        # Pool de hilos compartido de la aplicación para la validación de integridad
+        self.executor = executor
+        # Firma del último esquema mostrado
+        self._last_schema_sig = None
+        
+        # Pestañas pendientes de actualizar para el esquema actual
+        self._dirty_tabs = set()
+        
+        # Grafo de dependencias del último esquema y sus tablas por nivel (ordenadas):
+        # (id(schema_info), grafo, {nivel: [tablas]})
+        self._dep_graph_cache = (None, None, {})
+        
+        # Creados al primer uso (ver las propiedades)
+        self._dependency_resolver = None
+        self._integrity_analyzer = None
         
         # Configurar UI
         self.setup_ui()
-        
-        # Dependency resolver
-        from dependency_resolver import DependencyResolver
-        self.dependency_resolver = DependencyResolver()
+    
+    @property
+    def dependency_resolver(self):
+        """Dependency resolver (creado al primer uso)"""
+        if self._dependency_resolver is None:
+            from dependency_resolver import DependencyResolver
+            self._dependency_resolver = DependencyResolver()
+        return self._dependency_resolver
+    
+    @property
+    def integrity_analyzer(self):
+        """Analizador usado solo para validar integridad (sin conexión)"""
+        if self._integrity_analyzer is None:
+            from schema_analyzer import SchemaAnalyzer
+            self._integrity_analyzer = SchemaAnalyzer(None)
+        return self._integrity_analyzer
     
     def setup_ui(self):
         """Configura la interfaz moderna de visualización"""
@@ -420,12 +721,12 @@ class ModernSchemaVisualizationFrame(ctk.CTkFrame):
         title_label = ctk.CTkLabel(
             self,
             text="📊 Análisis de Esquema",
-            font=ctk.CTkFont(size=18, weight="bold")
+            font=_font(18, "bold")
         )
         title_label.pack(pady=(10, 20))
         
         # Tabview moderno para diferentes vistas
-        self.tabview = ctk.CTkTabview(self, width=400, height=300)
+        self.tabview = ctk.CTkTabview(self, width=400, height=300, command=self._on_tab_changed)
         self.tabview.pack(fill='both', expand=True, padx=10, pady=(0, 10))
         
         # Pestañas modernas
@@ -452,7 +753,7 @@ class ModernSchemaVisualizationFrame(ctk.CTkFrame):
         self.stats_label = ctk.CTkLabel(
             stats_frame,
             text="💤 Analiza un esquema para ver estadísticas",
-            font=ctk.CTkFont(size=12),
+            font=_font(12),
             justify="left"
         )
         self.stats_label.pack(padx=20, pady=20)
@@ -464,12 +765,50 @@ class ModernSchemaVisualizationFrame(ctk.CTkFrame):
         ctk.CTkLabel(
             tables_frame,
             text="📊 Tablas del Esquema",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=_font(14, "bold")
         ).pack(pady=(10, 5))
         
-        # Crear textbox scrollable para tablas
-        self.tables_textbox = ctk.CTkTextbox(tables_frame, height=200)
-        self.tables_textbox.pack(fill='both', expand=True, padx=10, pady=(0, 10))
+        # Treeview para tablas: solo dibuja las filas visibles, a diferencia
+        # de un textbox que maqueta todas las líneas
+        tree_container = ctk.CTkFrame(tables_frame, fg_color="transparent")
+        tree_container.pack(fill='both', expand=True, padx=10, pady=(0, 10))
+        
+        # Estilo propio con los colores del tema CTk (ttk no sigue el modo oscuro)
+        self._tree_style = ttk.Style(self)
+        self._tree_style.theme_use("default")
+        self.update_tree_style()
+        
+        columns = ("rows", "cols", "fks", "deps")
+        self.tables_tree = ttk.Treeview(tree_container, columns=columns, height=10,
+                                        style="Summary.Treeview")
+        self.tables_tree.heading("#0", text="Tabla")
+        self.tables_tree.column("#0", width=220, stretch=True)
+        for column, heading in zip(columns, ("Filas", "Cols", "FKs", "Deps")):
+            self.tables_tree.heading(column, text=heading)
+            self.tables_tree.column(column, width=80, anchor='e', stretch=False)
+        
+        scrollbar = ctk.CTkScrollbar(tree_container, command=self.tables_tree.yview)
+        self.tables_tree.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side='right', fill='y')
+        self.tables_tree.pack(side='left', fill='both', expand=True)
+    
+    def update_tree_style(self):
+        """Aplica al Treeview del resumen los colores del modo de apariencia actual"""
+        mode = 1 if ctk.get_appearance_mode() == "Dark" else 0
+        theme = ctk.ThemeManager.theme
+        frame = theme["CTkFrame"]
+        background = frame["fg_color"][mode]
+        heading = frame.get("top_fg_color", frame["fg_color"])[mode]
+        text = theme["CTkLabel"]["text_color"][mode]
+        selected = theme["CTkButton"]["fg_color"][mode]
+        
+        style = self._tree_style
+        style.configure("Summary.Treeview", background=background, fieldbackground=background,
+                        foreground=text, borderwidth=0)
+        style.map("Summary.Treeview", background=[('selected', selected)])
+        style.configure("Summary.Treeview.Heading", background=heading, foreground=text,
+                        relief="flat")
+        style.map("Summary.Treeview.Heading", background=[('active', selected)])
     
     def setup_dependencies_tab(self):
         """Configura pestaña de dependencias moderna"""
@@ -482,10 +821,10 @@ class ModernSchemaVisualizationFrame(ctk.CTkFrame):
         ctk.CTkLabel(
             tree_frame,
             text="🌳 Árbol de Dependencias",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=_font(14, "bold")
         ).pack(pady=(10, 5))
         
-        self.deps_textbox = ctk.CTkTextbox(tree_frame)
+        self.deps_textbox = _readonly_textbox(tree_frame)
         self.deps_textbox.pack(fill='both', expand=True, padx=10, pady=(0, 10))
     
     def setup_order_tab(self):
@@ -498,10 +837,10 @@ class ModernSchemaVisualizationFrame(ctk.CTkFrame):
         ctk.CTkLabel(
             order_frame,
             text="🎯 Orden de Transferencia",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=_font(14, "bold")
         ).pack(pady=(10, 5))
         
-        self.order_textbox = ctk.CTkTextbox(order_frame)
+        self.order_textbox = _readonly_textbox(order_frame)
         self.order_textbox.pack(fill='both', expand=True, padx=10, pady=(0, 10))
     
     def setup_objects_tab(self):
@@ -527,7 +866,7 @@ class ModernSchemaVisualizationFrame(ctk.CTkFrame):
         for tab_name, obj_type in object_types:
             self.objects_tabview.add(tab_name)
             
-            textbox = ctk.CTkTextbox(self.objects_tabview.tab(tab_name))
+            textbox = _readonly_textbox(self.objects_tabview.tab(tab_name))
             textbox.pack(fill='both', expand=True, padx=5, pady=5)
             
             self.object_textboxes[obj_type] = textbox
@@ -542,32 +881,100 @@ class ModernSchemaVisualizationFrame(ctk.CTkFrame):
         ctk.CTkLabel(
             problems_frame,
             text="🔍 Problemas Detectados",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=_font(14, "bold")
         ).pack(pady=(10, 5))
         
-        self.problems_textbox = ctk.CTkTextbox(problems_frame)
+        self.problems_textbox = _readonly_textbox(problems_frame)
         self.problems_textbox.pack(fill='both', expand=True, padx=10, pady=(0, 10))
     
-    def update_schema_info(self, schema_info: SchemaInfo):
+    def clear(self):
+        """Vacía la visualización (sin recalcular ninguna pestaña)"""
+        self.schema_info = None
+        self._last_schema_sig = None
+        self._dirty_tabs = set()
+        
+        self.stats_label.configure(text="💤 Analiza un esquema para ver estadísticas")
+        self.tables_tree.delete(*self.tables_tree.get_children())
+        for textbox in (self.deps_textbox, self.order_textbox, self.problems_textbox,
+                        *self.object_textboxes.values()):
+            _set_text(textbox, "")
+    
+    def update_schema_info(self, schema_info: "SchemaInfo"):
         """Actualiza la visualización con nueva información del esquema"""
+        # Mismo esquema que ya se muestra: las pestañas están al día
+        # (self.schema_info mantiene vivo el objeto, así que su id no se reutiliza)
+        sig = (id(schema_info), schema_info.schema_name,
+               len(schema_info.objects.tables), len(schema_info.dependency_order))
+        if sig == self._last_schema_sig:
+            return
+        self._last_schema_sig = sig
+        
         self.schema_info = schema_info
+        self._dirty_tabs = set(self.TAB_UPDATERS)
         
-        self.update_summary_tab()
-        self.update_dependencies_tab()
-        self.update_order_tab()
-        self.update_objects_tab()
-        self.update_problems_tab()
+        # La pestaña visible se actualiza ya; el resto cuando Tk esté libre
+        self._refresh_tab(self.tabview.get())
+        self.after_idle(self._refresh_next_tab)
+    
+    def _get_dep_graph(self):
+        """Obtiene el grafo de dependencias, construyéndolo una sola vez por esquema"""
+        schema_id = id(self.schema_info)
+        if self._dep_graph_cache[0] != schema_id:
+            dep_graph = self.dependency_resolver.create_dependency_graph(self.schema_info)
+            
+            # Agrupar por nivel en una sola pasada y ordenar una vez
+            by_level = {}
+            for name, level in dep_graph.levels.items():
+                by_level.setdefault(level, []).append(name)
+            tables_by_level = {level: sorted(by_level[level]) for level in sorted(by_level)}
+            
+            self._dep_graph_cache = (schema_id, dep_graph, tables_by_level)
+        return self._dep_graph_cache[1]
+    
+    def _get_tables_by_level(self) -> Dict[int, List[str]]:
+        """Tablas ordenadas de cada nivel de dependencia, en orden de nivel"""
+        self._get_dep_graph()
+        return self._dep_graph_cache[2]
+    
+    def _refresh_tab(self, tab_name: str):
+        """Actualiza una pestaña si está pendiente"""
+        if tab_name in self._dirty_tabs:
+            self._dirty_tabs.discard(tab_name)
+            getattr(self, self.TAB_UPDATERS[tab_name])()
+    
+    def _refresh_next_tab(self):
+        """Actualiza la siguiente pestaña pendiente, una por ciclo ocioso
+        
+        Cada una se programa en un after_idle nuevo para que Tk pueda
+        redibujar entre pestañas.
+        """
+        pending = [name for name in self.TAB_UPDATERS
+                   if name in self._dirty_tabs and name not in self.LAZY_TABS]
+        if pending:
+            self._refresh_tab(pending[0])
+            if len(pending) > 1:
+                self.after_idle(self._refresh_next_tab)
+    
+    def _on_tab_changed(self):
+        """Actualiza la pestaña seleccionada si quedó pendiente"""
+        self._refresh_tab(self.tabview.get())
     
     def update_summary_tab(self):
         """Actualiza pestaña de resumen"""
         if not self.schema_info:
             return
         
+        # Filas de la lista de tablas; los totales ya vienen en schema_info
+        tables = self.schema_info.objects.tables
+        rows = [(name, (f"{table.row_count:,}", len(table.columns),
+                        len(table.foreign_keys), len(table.dependencies)))
+                for name, table in tables.items()]
+        
         # Estadísticas modernas con iconos
         stats_text = f"""🎯 ESQUEMA: {self.schema_info.schema_name}
 
 📊 OBJETOS:
-   📋 Tablas: {len(self.schema_info.objects.tables)}
+   📋 Tablas: {len(tables)}
    👁 Vistas: {len(self.schema_info.objects.views)}  
    🔢 Secuencias: {len(self.schema_info.objects.sequences)}
    ⚙️ Procedimientos: {len(self.schema_info.objects.procedures)}
@@ -575,185 +982,136 @@ class ModernSchemaVisualizationFrame(ctk.CTkFrame):
    📇 Índices: {len(self.schema_info.objects.indexes)}
 
 💾 DATOS:
-   📊 Filas totales: {sum(t.row_count for t in self.schema_info.objects.tables.values()):,}
-   🔗 Llaves foráneas: {sum(len(t.foreign_keys) for t in self.schema_info.objects.tables.values())}
-   📚 Niveles dependencia: {len(set(self.dependency_resolver.create_dependency_graph(self.schema_info).levels.values()))}"""
+   📊 Filas totales: {self.schema_info.total_rows:,}
+   🔗 Llaves foráneas: {self.schema_info.total_fks}
+   📚 Niveles dependencia: {len(self._get_tables_by_level())}"""
         
         self.stats_label.configure(text=stats_text)
         
         # Lista de tablas
-        self.tables_textbox.delete("0.0", "end")
+        tree = self.tables_tree
         
-        if self.schema_info.objects.tables:
-            tables_info = "TABLA                      FILAS      COLS  FKs  DEPS\n"
-            tables_info += "─" * 55 + "\n"
-            
-            for name, table in self.schema_info.objects.tables.items():
-                tables_info += f"{name:<25} {table.row_count:>8,} {len(table.columns):>4} {len(table.foreign_keys):>3} {len(table.dependencies):>4}\n"
-        else:
-            tables_info = "❌ No se encontraron tablas en el esquema"
+        if not rows:
+            rows = [("❌ No se encontraron tablas en el esquema", ())]
         
-        self.tables_textbox.insert("0.0", tables_info)
+        # Con el árbol desempaquetado (sin redibujos intermedios), insertar al
+        # inicio en orden inverso: 'end' recorre los hermanos, O(n) por fila
+        tree.pack_forget()
+        try:
+            tree.delete(*tree.get_children())
+            for name, values in reversed(rows):
+                tree.insert('', 0, text=name, values=values)
+        finally:
+            tree.pack(side='left', fill='both', expand=True)
     
     def update_dependencies_tab(self):
         """Actualiza pestaña de dependencias"""
         if not self.schema_info:
             return
         
-        self.deps_textbox.delete("0.0", "end")
-        
         try:
             # Crear grafo de dependencias
-            dep_graph = self.dependency_resolver.create_dependency_graph(self.schema_info)
+            dep_graph = self._get_dep_graph()
             
-            deps_text = "🌳 ÁRBOL DE DEPENDENCIAS\n"
-            deps_text += "═" * 40 + "\n\n"
+            parts = ["🌳 ÁRBOL DE DEPENDENCIAS\n", "═" * 40 + "\n\n"]
             
             # Mostrar por niveles
-            for level in sorted(set(dep_graph.levels.values())):
-                tables_in_level = [name for name, lvl in dep_graph.levels.items() if lvl == level]
-                if tables_in_level:
-                    deps_text += f"📊 NIVEL {level}:\n"
-                    for table in sorted(tables_in_level):
-                        deps_text += f"   └─ {table}\n"
-                    deps_text += "\n"
+            for level, tables_in_level in self._get_tables_by_level().items():
+                parts.append(f"📊 NIVEL {level}:\n")
+                parts.extend(f"   └─ {table}\n" for table in tables_in_level)
+                parts.append("\n")
             
             # Mostrar ciclos si existen
             if dep_graph.cycles:
-                deps_text += "⚠️  CICLOS DETECTADOS:\n"
-                for i, cycle in enumerate(dep_graph.cycles, 1):
-                    deps_text += f"   🔄 Ciclo {i}: {' → '.join(cycle)}\n"
+                parts.append("⚠️  CICLOS DETECTADOS:\n")
+                parts.extend(f"   🔄 Ciclo {i}: {' → '.join(cycle)}\n"
+                             for i, cycle in enumerate(dep_graph.cycles, 1))
+            
+            deps_text = "".join(parts)
             
         except Exception as e:
             deps_text = f"❌ Error generando árbol de dependencias:\n{str(e)}"
         
-        self.deps_textbox.insert("0.0", deps_text)
+        _set_text(self.deps_textbox, deps_text)
     
     def update_order_tab(self):
         """Actualiza pestaña de orden"""
         if not self.schema_info:
             return
         
-        self.order_textbox.delete("0.0", "end")
-        
-        order_text = "🎯 ORDEN DE TRANSFERENCIA\n"
-        order_text += "═" * 40 + "\n\n"
+        parts = ["🎯 ORDEN DE TRANSFERENCIA\n", "═" * 40 + "\n\n"]
         
         for i, table_name in enumerate(self.schema_info.dependency_order, 1):
             if table_name in self.schema_info.objects.tables:
                 table_info = self.schema_info.objects.tables[table_name]
-                order_text += f"{i:>3}. 📋 {table_name:<25} ({table_info.row_count:,} filas)\n"
+                parts.append(f"{i:>3}. 📋 {table_name:<25} ({table_info.row_count:,} filas)\n")
         
-        self.order_textbox.insert("0.0", order_text)
+        _set_text(self.order_textbox, "".join(parts))
     
     def update_objects_tab(self):
         """Actualiza pestaña de objetos"""
         if not self.schema_info:
             return
         
-        # Tablas
-        tables_text = "📊 TABLAS\n" + "═" * 30 + "\n\n"
-        for name, table in self.schema_info.objects.tables.items():
-            tables_text += f"📋 {name}\n"
-            tables_text += f"   📊 Filas: {table.row_count:,}\n"
-            tables_text += f"   📄 Columnas: {len(table.columns)}\n"
-            tables_text += f"   🔗 FKs: {len(table.foreign_keys)}\n"
-            tables_text += f"   📚 Deps: {len(table.dependencies)}\n\n"
-        
-        self.object_textboxes["tables"].delete("0.0", "end")
-        self.object_textboxes["tables"].insert("0.0", tables_text)
-        
-        # Vistas
-        views_text = "👁 VISTAS\n" + "═" * 30 + "\n\n"
-        for name, view in self.schema_info.objects.views.items():
-            views_text += f"👁 {name}\n"
-            views_text += f"   ✏️  Actualizable: {'Sí' if view.is_updatable else 'No'}\n"
-            views_text += f"   📄 Columnas: {len(view.columns)}\n"
-            views_text += f"   📚 Deps: {len(view.dependencies)}\n\n"
-        
-        self.object_textboxes["views"].delete("0.0", "end")
-        self.object_textboxes["views"].insert("0.0", views_text)
-        
-        # Secuencias
-        sequences_text = "🔢 SECUENCIAS\n" + "═" * 30 + "\n\n"
-        for name, seq in self.schema_info.objects.sequences.items():
-            sequences_text += f"🔢 {name}\n"
-            sequences_text += f"   🎯 Inicio: {seq.start_value}\n"
-            sequences_text += f"   ⬆️  Incremento: {seq.increment_by}\n"
-            sequences_text += f"   🔄 Ciclo: {'Sí' if seq.cycle_flag else 'No'}\n\n"
-        
-        self.object_textboxes["sequences"].delete("0.0", "end")
-        self.object_textboxes["sequences"].insert("0.0", sequences_text)
-        
-        # Procedimientos
-        procedures_text = "⚙️ PROCEDIMIENTOS\n" + "═" * 30 + "\n\n"
-        for name, proc in self.schema_info.objects.procedures.items():
-            procedures_text += f"⚙️ {name}\n"
-            procedures_text += f"   🏷️  Tipo: {proc.procedure_type}\n"
-            procedures_text += f"   🗣️  Lenguaje: {proc.language}\n"
-            procedures_text += f"   📋 Parámetros: {len(proc.parameters)}\n\n"
-        
-        self.object_textboxes["procedures"].delete("0.0", "end")
-        self.object_textboxes["procedures"].insert("0.0", procedures_text)
-        
-        # Triggers
-        triggers_text = "🎯 TRIGGERS\n" + "═" * 30 + "\n\n"
-        for name, trigger in self.schema_info.objects.triggers.items():
-            triggers_text += f"🎯 {name}\n"
-            triggers_text += f"   📋 Tabla: {trigger.table_name}\n"
-            triggers_text += f"   🏷️  Tipo: {trigger.trigger_type}\n"
-            triggers_text += f"   ⚡ Evento: {trigger.triggering_event}\n"
-            triggers_text += f"   🔘 Estado: {trigger.status}\n\n"
-        
-        self.object_textboxes["triggers"].delete("0.0", "end")
-        self.object_textboxes["triggers"].insert("0.0", triggers_text)
-        
-        # Índices
-        indexes_text = "📇 ÍNDICES\n" + "═" * 30 + "\n\n"
-        for name, index in self.schema_info.objects.indexes.items():
-            if not self._is_system_index(index):
-                indexes_text += f"📇 {name}\n"
-                indexes_text += f"   📋 Tabla: {index.table_name}\n"
-                indexes_text += f"   🏷️  Tipo: {index.index_type}\n"
-                indexes_text += f"   🔒 Único: {'Sí' if index.is_unique else 'No'}\n"
-                indexes_text += f"   📄 Columnas: {', '.join(index.columns)}\n\n"
-        
-        self.object_textboxes["indexes"].delete("0.0", "end")
-        self.object_textboxes["indexes"].insert("0.0", indexes_text)
+        for key, header, render, skip_name in self.OBJECT_RENDERERS:
+            skip = getattr(self, skip_name) if skip_name else None
+            parts = [f"{header}\n" + "═" * 30 + "\n\n"]
+            parts.extend(render(name, obj)
+                         for name, obj in getattr(self.schema_info.objects, key).items()
+                         if skip is None or not skip(obj))
+            
+            _set_text(self.object_textboxes[key], "".join(parts))
     
     def update_problems_tab(self):
-        """Actualiza pestaña de problemas"""
+        """Actualiza pestaña de problemas
+        
+        La validación de integridad corre en el pool de hilos y el texto
+        resultante se inserta en el hilo principal.
+        """
         if not self.schema_info:
             return
         
-        self.problems_textbox.delete("0.0", "end")
-        
-        # Validar integridad del esquema
-        from schema_analyzer import SchemaAnalyzer
-        analyzer = SchemaAnalyzer(None)
-        issues = analyzer.validate_schema_integrity(self.schema_info)
+        _set_text(self.problems_textbox, "⏳ Analizando...")
         
-        problems_text = "🔍 PROBLEMAS DETECTADOS\n"
-        problems_text += "═" * 40 + "\n\n"
+        schema_info = self.schema_info
+        # El analizador se crea aquí, en el hilo principal
+        analyzer = self.integrity_analyzer
+        self.executor.submit(self._compute_problems, analyzer, schema_info)
+    
+    def _compute_problems(self, analyzer, schema_info: "SchemaInfo"):
+        """Valida el esquema y arma el texto de problemas (sin llamadas a Tk)"""
+        try:
+            # Validar integridad del esquema
+            issues = analyzer.validate_schema_integrity(schema_info)
+            
+            parts = ["🔍 PROBLEMAS DETECTADOS\n", "═" * 40 + "\n\n"]
+            
+            if issues:
+                for issue in issues:
+                    icon = "⚠️" if issue["type"] == "no_primary_key" else "❌"
+                    parts.append(f"{icon} {issue['type'].upper()}\n"
+                                 f"   📋 Tabla: {issue['table']}\n"
+                                 f"   📝 Descripción: {issue['description']}\n\n")
+            else:
+                parts.append("✅ No se detectaron problemas en el esquema\n"
+                             "🎉 El esquema tiene una estructura válida")
+            
+            problems_text = "".join(parts)
+        except Exception as e:
+            problems_text = f"❌ Error validando el esquema:\n{str(e)}"
         
-        if issues:
-            for issue in issues:
-                icon = "⚠️" if issue["type"] == "no_primary_key" else "❌"
-                problems_text += f"{icon} {issue['type'].upper()}\n"
-                problems_text += f"   📋 Tabla: {issue['table']}\n"
-                problems_text += f"   📝 Descripción: {issue['description']}\n\n"
-        else:
-            problems_text += "✅ No se detectaron problemas en el esquema\n"
-            problems_text += "🎉 El esquema tiene una estructura válida"
+        self.after(0, self._show_problems, schema_info, problems_text)
+    
+    def _show_problems(self, schema_info: "SchemaInfo", problems_text: str):
+        """Muestra el texto de problemas si sigue correspondiendo al esquema actual"""
+        if schema_info is not self.schema_info:
+            return
         
-        self.problems_textbox.insert("0.0", problems_text)
+        _set_text(self.problems_textbox, problems_text)
     
     def _is_system_index(self, index_info) -> bool:
         """Determina si un índice es del sistema"""
-        index_name = index_info.index_name.upper()
-        return (index_name.startswith('PK_') or 
-                index_name.startswith('FK_') or
-                index_name.startswith('SYS_'))
+        return index_info.index_name.upper().startswith(self.SYSTEM_INDEX_PREFIXES)
 
 
 class ModernMainGUI:
@@ -765,39 +1123,68 @@ class ModernMainGUI:
         self.root.title("🚀 Pasador de Esquemas de BD - Versión Moderna")
         self.root.geometry("1400x900")
         
-        # Configurar grid
-        self.root.grid_rowconfigure(0, weight=1)
+        # Configurar grid (fila 0: barra de menús)
+        self.root.grid_rowconfigure(1, weight=1)
         self.root.grid_columnconfigure(0, weight=1)
         
-        # Componentes del negocio
-        self.db_manager = DatabaseManager()
-        self.schema_analyzer = SchemaAnalyzer(self.db_manager)
-        self.dependency_resolver = DependencyResolver()
-        self.schema_exporter = SchemaExporter()
+        # Componentes del negocio (ver las propiedades db_manager y schema_analyzer)
+        self._db_manager = None
+        self._schema_analyzer = None
         
-        # Variables de estado
-        self.source_schema_info: Optional[SchemaInfo] = None
+        # Pool acotado de hilos compartido por los frames de conexión
+        self.executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="db")
         
-        # Configurar logging
-        logging.basicConfig(level=logging.INFO)
+        # Variables de estado
+        self.source_schema_info: Optional["SchemaInfo"] = None
+        # Último avance del análisis aún no mostrado y si hay un refresco programado
+        self._pending_progress = None
+        self._progress_scheduled = False
+        # Tema elegido (el del módulo al inicio) y su aplicación pendiente
+        self._theme = "system"
+        self._theme_after = None
         
         # Variables para opciones de análisis (ANTES de configurar UI)
-        self.include_views_var = ctk.BooleanVar(value=True)
-        self.include_sequences_var = ctk.BooleanVar(value=True)
-        self.include_procedures_var = ctk.BooleanVar(value=True)
-        self.include_triggers_var = ctk.BooleanVar(value=True)
-        self.include_indexes_var = ctk.BooleanVar(value=True)
+        self.include_views_var = tk.BooleanVar(master=self.root, value=True)
+        self.include_sequences_var = tk.BooleanVar(master=self.root, value=True)
+        self.include_procedures_var = tk.BooleanVar(master=self.root, value=True)
+        self.include_triggers_var = tk.BooleanVar(master=self.root, value=True)
+        self.include_indexes_var = tk.BooleanVar(master=self.root, value=True)
         
         # Configurar interfaz
         self.setup_ui()
-        self.setup_menu()
+        
+        # Cargar los componentes del negocio en el hilo principal después del
+        # primer dibujo (así los hilos de trabajo ya los encuentran creados)
+        self.root.after(100, self._load_backend)
+    
+    # Componentes del negocio, creados al primer uso
+    @property
+    def db_manager(self) -> "DatabaseManager":
+        if self._db_manager is None:
+            from database_manager import DatabaseManager
+            self._db_manager = DatabaseManager()
+        return self._db_manager
+    
+    @property
+    def schema_analyzer(self):
+        if self._schema_analyzer is None:
+            from schema_analyzer import SchemaAnalyzer
+            self._schema_analyzer = SchemaAnalyzer(self.db_manager)
+        return self._schema_analyzer
+    
+    def _load_backend(self):
+        """Crea los componentes que usan los hilos de conexión y análisis"""
+        self.db_manager
+        self.schema_analyzer
     
     def setup_ui(self):
         """Configura la interfaz moderna"""
         
+        self.setup_menu_bar()
+        
         # Frame principal
         main_frame = ctk.CTkFrame(self.root)
-        main_frame.grid(row=0, column=0, sticky='nsew', padx=10, pady=10)
+        main_frame.grid(row=1, column=0, sticky='nsew', padx=10, pady=(0, 10))
         main_frame.grid_rowconfigure(0, weight=1)
         main_frame.grid_columnconfigure(1, weight=2)
         
@@ -816,63 +1203,76 @@ class ModernMainGUI:
         self.setup_right_panel(right_panel)
     
     def setup_left_panel(self, parent):
-        """Configura panel izquierdo moderno"""
+        """Configura panel izquierdo moderno
+        
+        Al inicio solo se crea lo necesario para analizar el origen; la
+        conexión destino y las acciones se crean tras el primer análisis.
+        """
+        self._left_panel = parent
+        self._build_source_panel(parent)
+        
+        # Creados por _build_actions_panel
+        self.target_frame = None
+        self.select_tables_btn = None
+        self.transfer_btn = None
+        self.export_btn = None
+        self.progress_label = None
+        self.progress_bar = None
+        
+        # Estado del análisis; hasta que existe el panel de acciones se muestra
+        # en una etiqueta temporal del frame de análisis
+        self.progress_var = ctk.StringVar(value="🔮 Listo para analizar esquema")
+        self._analysis_status_label = None
+    
+    def _build_source_panel(self, parent):
+        """Crea la conexión origen y el frame de análisis"""
         
         # Conexión origen
-        self.source_frame = ModernConnectionFrame(parent, "Base de Datos Origen", "source")
+        self.source_frame = ModernConnectionFrame(parent, "Base de Datos Origen", "source", self.executor,
+                                                  lambda: self.db_manager)
         self.source_frame.grid(row=0, column=0, sticky='ew', pady=(0, 10))
         
-        # Frame de análisis y opciones
+        # Frame de análisis y opciones (se ubica una vez completo: un solo
+        # cálculo de geometría en lugar de uno por widget)
         analysis_frame = ctk.CTkFrame(parent)
-        analysis_frame.grid(row=1, column=0, sticky='ew', pady=(0, 10))
         
         # Título de análisis
         ctk.CTkLabel(
             analysis_frame,
             text="🔍 Análisis de Esquema",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=_font(14, "bold")
         ).pack(pady=(15, 10))
         
-        # Opciones de objetos a analizar
-        options_frame = ctk.CTkFrame(analysis_frame)
-        options_frame.pack(fill='x', padx=15, pady=(0, 10))
-        
+        # Opciones de objetos a analizar, directamente en el frame de análisis
         ctk.CTkLabel(
-            options_frame,
+            analysis_frame,
             text="Objetos a Incluir:",
-            font=ctk.CTkFont(size=12, weight="bold")
-        ).pack(anchor='w', padx=10, pady=(10, 5))
+            font=_font(12, "bold")
+        ).pack(anchor='w', padx=25, pady=(10, 5))
+        
+        # Las tablas siempre se incluyen: basta una etiqueta
+        ctk.CTkLabel(
+            analysis_frame,
+            text="📊 Tablas (siempre) ✓",
+            font=_font(11)
+        ).pack(anchor='w', padx=30, pady=2)
         
         # Checkboxes modernos
         options = [
-            ("📊 Tablas (siempre)", None, True, False),
-            ("👁 Vistas", self.include_views_var, True, True),
-            ("🔢 Secuencias", self.include_sequences_var, True, True),
-            ("⚙️ Procedimientos", self.include_procedures_var, True, True), 
-            ("🎯 Triggers", self.include_triggers_var, True, True),
-            ("📇 Índices", self.include_indexes_var, True, True)
+            ("👁 Vistas", self.include_views_var),
+            ("🔢 Secuencias", self.include_sequences_var),
+            ("⚙️ Procedimientos", self.include_procedures_var),
+            ("🎯 Triggers", self.include_triggers_var),
+            ("📇 Índices", self.include_indexes_var)
         ]
         
-        for text, var, default, enabled in options:
-            if var:
-                checkbox = ctk.CTkCheckBox(
-                    options_frame,
-                    text=text,
-                    variable=var,
-                    font=ctk.CTkFont(size=11)
-                )
-                if not enabled:
-                    checkbox.configure(state="disabled")
-            else:
-                checkbox = ctk.CTkCheckBox(
-                    options_frame,
-                    text=text,
-                    font=ctk.CTkFont(size=11),
-                    state="disabled"
-                )
-                checkbox.select()  # Siempre seleccionado para tablas
-            
-            checkbox.pack(anchor='w', padx=15, pady=2)
+        for text, var in options:
+            ctk.CTkCheckBox(
+                analysis_frame,
+                text=text,
+                variable=var,
+                font=_font(11)
+            ).pack(anchor='w', padx=30, pady=2)
         
         # Botón de análisis moderno
         self.analyze_btn = ctk.CTkButton(
@@ -880,127 +1280,145 @@ class ModernMainGUI:
             text="🚀 Analizar Esquema",
             command=self.analyze_schema,
             height=40,
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=_font(14, "bold")
         )
-        self.analyze_btn.pack(fill='x', padx=15, pady=(10, 15))
+        self.analyze_btn.pack(fill='x', padx=15, pady=(20, 15))
+        
+        analysis_frame.grid(row=1, column=0, sticky='ew', pady=(0, 10))
+        self._analysis_frame = analysis_frame
+    
+    def _build_actions_panel(self, parent):
+        """Crea la conexión destino, los botones de acción y la barra de progreso"""
         
         # Conexión destino
-        self.target_frame = ModernConnectionFrame(parent, "Base de Datos Destino", "target")
+        self.target_frame = ModernConnectionFrame(parent, "Base de Datos Destino", "target", self.executor,
+                                                  lambda: self.db_manager)
         self.target_frame.grid(row=2, column=0, sticky='ew', pady=(0, 10))
         
-        # Botones de acción modernos
+        # Botones de acción modernos (el frame se ubica al final)
         actions_frame = ctk.CTkFrame(parent)
-        actions_frame.grid(row=3, column=0, sticky='ew')
         
         ctk.CTkLabel(
             actions_frame,
             text="🎯 Acciones",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=_font(14, "bold")
         ).pack(pady=(15, 10))
         
         # Botones de transferencia y exportar
-        buttons_frame = ctk.CTkFrame(actions_frame)
-        buttons_frame.pack(fill='x', padx=15, pady=(0, 10))
-        
         self.select_tables_btn = ctk.CTkButton(
-            buttons_frame,
+            actions_frame,
             text="📋 Seleccionar Tablas",
             command=self.select_tables,
             state="disabled",
             height=35
         )
-        self.select_tables_btn.pack(fill='x', pady=2)
+        self.select_tables_btn.pack(fill='x', padx=15, pady=2)
         
         self.transfer_btn = ctk.CTkButton(
-            buttons_frame,
+            actions_frame,
             text="🚀 Iniciar Transferencia",
             command=self.start_transfer,
             state="disabled",
             height=35
         )
-        self.transfer_btn.pack(fill='x', pady=2)
+        self.transfer_btn.pack(fill='x', padx=15, pady=2)
         
         self.export_btn = ctk.CTkButton(
-            buttons_frame,
+            actions_frame,
             text="📤 Exportar Esquema",
             command=self.show_export_dialog,
             state="disabled",
             height=35
         )
-        self.export_btn.pack(fill='x', pady=2)
+        self.export_btn.pack(fill='x', padx=15, pady=(2, 12))
         
         # Barra de progreso moderna
-        self.progress_var = ctk.StringVar(value="🔮 Listo para analizar esquema")
         self.progress_label = ctk.CTkLabel(actions_frame, textvariable=self.progress_var)
         self.progress_label.pack(padx=15, pady=(10, 5))
         
         self.progress_bar = ctk.CTkProgressBar(actions_frame)
         self.progress_bar.pack(fill='x', padx=15, pady=(0, 15))
         self.progress_bar.set(0)
+        
+        actions_frame.grid(row=3, column=0, sticky='ew')
+        
+        # La etiqueta temporal ya no hace falta
+        if self._analysis_status_label is not None:
+            self._analysis_status_label.destroy()
+            self._analysis_status_label = None
     
     def setup_right_panel(self, parent):
         """Configura panel derecho moderno"""
         
         # Frame de visualización moderno
-        self.viz_frame = ModernSchemaVisualizationFrame(parent)
+        self.viz_frame = ModernSchemaVisualizationFrame(parent, self.executor)
         self.viz_frame.grid(row=0, column=0, sticky='nsew')
     
-    def setup_menu(self):
-        """Configura menú moderno (usando tkinter tradicional para menús)"""
-        # CustomTkinter no tiene menús nativos, usar tkinter
-        menubar = tk.Menu(self.root)
-        self.root.configure(menu=menubar)
-        
-        # Menú Archivo
-        file_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="📁 Archivo", menu=file_menu)
-        file_menu.add_command(label="💾 Guardar Config", command=self.save_config)
-        file_menu.add_command(label="📂 Cargar Config", command=self.load_config)
-        file_menu.add_separator()
-        file_menu.add_command(label="🔶 Config Oracle", command=self.load_oracle_config)
-        file_menu.add_separator()
-        file_menu.add_command(label="🚪 Salir", command=self.root.quit)
-        
-        # Menú Tema
-        theme_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="🎨 Tema", menu=theme_menu)
-        theme_menu.add_command(label="🌙 Modo Oscuro", command=lambda: self.change_theme("dark"))
-        theme_menu.add_command(label="☀️ Modo Claro", command=lambda: self.change_theme("light"))
-        theme_menu.add_command(label="💻 Sistema", command=lambda: self.change_theme("system"))
-        
-        # Menú Ayuda
-        help_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="❓ Ayuda", menu=help_menu)
-        help_menu.add_command(label="📖 Acerca de", command=self.show_about)
+    def setup_menu_bar(self):
+        """Configura la barra de menús con CTkOptionMenu (sin tk.Menu)"""
+        self._menu_actions = {
+            "💾 Guardar Config": self.save_config,
+            "📂 Cargar Config": self.load_config,
+            "🔶 Config Oracle": self.load_oracle_config,
+            "🚪 Salir": self.root.quit,
+            "🌙 Modo Oscuro": lambda: self.change_theme("dark"),
+            "☀️ Modo Claro": lambda: self.change_theme("light"),
+            "💻 Sistema": lambda: self.change_theme("system"),
+            "📖 Acerca de": self.show_about
+        }
+        
+        menus = [
+            ("📁 Archivo", ["💾 Guardar Config", "📂 Cargar Config", "🔶 Config Oracle", "🚪 Salir"]),
+            ("🎨 Tema", ["🌙 Modo Oscuro", "☀️ Modo Claro", "💻 Sistema"]),
+            ("❓ Ayuda", ["📖 Acerca de"])
+        ]
+        
+        menu_bar = ctk.CTkFrame(self.root, fg_color="transparent")
+        
+        self._menus = {}
+        for title, values in menus:
+            menu = ctk.CTkOptionMenu(
+                menu_bar,
+                values=values,
+                command=self._menu_dispatch,
+                width=130
+            )
+            menu.set(title)
+            menu.pack(side='left', padx=(0, 5))
+            self._menus[title] = menu
+        
+        menu_bar.grid(row=0, column=0, sticky='w', padx=10, pady=(10, 5))
+    
+    def _menu_dispatch(self, label: str):
+        """Ejecuta la acción elegida y vuelve a mostrar los títulos de los menús"""
+        for title, menu in self._menus.items():
+            menu.set(title)
+        self._menu_actions[label]()
     
     def change_theme(self, theme: str):
-        """Cambia el tema de la aplicación"""
-        ctk.set_appearance_mode(theme)
-        messagebox.showinfo("Tema Cambiado", f"Tema cambiado a: {theme}")
+        """Cambia el tema de la aplicación
+        
+        Los cambios seguidos se agrupan en uno solo: cada cambio de tema
+        redibuja todos los widgets.
+        """
+        if theme == self._theme:
+            return
+        self._theme = theme
+        
+        if self._theme_after is not None:
+            self.root.after_cancel(self._theme_after)
+        self._theme_after = self.root.after(50, self._apply_theme)
+    
+    def _apply_theme(self):
+        """Aplica el último tema elegido"""
+        self._theme_after = None
+        ctk.set_appearance_mode(self._theme)
+        # El Treeview es ttk: sus colores no cambian solos
+        self.viz_frame.update_tree_style()
     
     def show_about(self):
         """Muestra información sobre la aplicación"""
-        about_text = """🚀 Pasador de Esquemas de BD - Versión Moderna
-
-Una herramienta profesional para migración de esquemas de bases de datos
-con interfaz moderna usando CustomTkinter.
-
-✨ Características:
-• Interfaz moderna con temas dark/light
-• Soporte para múltiples tipos de BD
-• Análisis completo de dependencias
-• Exportación a múltiples formatos
-• Transferencia inteligente de datos
-
-🔧 Tecnologías:
-• Python 3.7+
-• CustomTkinter (GUI moderna)
-• SQLAlchemy (Abstracción de BD)
-• Pandas (Manipulación de datos)
-
-© 2025 - Herramienta de migración de esquemas"""
-        
-        messagebox.showinfo("Acerca de", about_text)
+        messagebox.showinfo("Acerca de", _ABOUT_TEXT)
     
     def analyze_schema(self):
         """Analiza el esquema seleccionado con interfaz moderna"""
@@ -1015,72 +1433,121 @@ con interfaz moderna usando CustomTkinter.
         
         # Actualizar UI para mostrar progreso
         self.progress_var.set("🔍 Analizando esquema...")
-        self.progress_bar.start()
+        # Sin animación indeterminada: redibujaría la barra cada pocos ms
+        if self.progress_bar is not None:
+            self.progress_bar.set(0)
+        elif self._analysis_status_label is None:
+            self._analysis_status_label = ctk.CTkLabel(self._analysis_frame, textvariable=self.progress_var)
+            self._analysis_status_label.pack(padx=15, pady=(0, 10))
         self.analyze_btn.configure(text="⏳ Analizando...", state="disabled")
         
-        def analyze_thread():
-            try:
-                config = self.source_frame.connection_config
-                engine = self.db_manager.get_engine("source", config['db_type'], config)
-                
-                # Analizar esquema con opciones seleccionadas
-                self.source_schema_info = self.schema_analyzer.analyze_schema(
-                    engine, config['db_type'], selected_schema,
-                    selected_tables=None,
-                    include_views=self.include_views_var.get(),
-                    include_procedures=self.include_procedures_var.get(),
-                    include_sequences=self.include_sequences_var.get(),
-                    include_triggers=self.include_triggers_var.get(),
-                    include_indexes=self.include_indexes_var.get()
-                )
-                
-                # Actualizar UI en hilo principal
-                self.root.after(0, self.on_analysis_complete)
-                
-            except Exception as e:
-                error_msg = f"Error analizando esquema: {str(e)}"
-                self.root.after(0, lambda: self.on_analysis_error(error_msg))
+        # Mismo pool persistente que las pruebas de conexión: sin crear un hilo por análisis
+        config = self.source_frame.connection_config
+        # Las variables Tk se leen aquí, en el hilo principal
+        flags = {
+            "include_views": self.include_views_var.get(),
+            "include_procedures": self.include_procedures_var.get(),
+            "include_sequences": self.include_sequences_var.get(),
+            "include_triggers": self.include_triggers_var.get(),
+            "include_indexes": self.include_indexes_var.get()
+        }
+        future = self.executor.submit(self._run_analysis, selected_schema, config, flags)
+        # Actualizar UI en hilo principal
+        future.add_done_callback(lambda f: self.root.after(0, self._on_analysis_done, f))
+    
+    def _run_analysis(self, selected_schema: str, config: Dict, flags: Dict[str, bool]):
+        """Analiza el esquema en el pool de hilos y calcula los totales del resumen"""
+        # Reanalizar con la misma configuración reutiliza el engine del frame origen
+        engine = self.source_frame.get_engine(config)
+        
+        # Analizar esquema con opciones seleccionadas
+        schema_info = self.schema_analyzer.analyze_schema(
+            engine, config['db_type'], selected_schema,
+            selected_tables=None,
+            progress_callback=self._post_progress,
+            **flags
+        )
+        
+        # Totales para el resumen, calculados fuera del hilo principal
+        summary = {
+            "total_objects": sum(schema_info.counts.values()),
+            "total_tables": schema_info.total_tables,
+            "total_rows": schema_info.total_rows
+        }
+        return schema_info, summary
+    
+    def _post_progress(self, fraction: float, message: str):
+        """Registra el avance del análisis (desde el hilo de trabajo)
+        
+        Solo se programa un refresco cada ~16 ms; entre refrescos cada aviso
+        reemplaza al anterior.
+        """
+        self._pending_progress = (fraction, message)
+        if not self._progress_scheduled:
+            self._progress_scheduled = True
+            self.root.after(16, self._flush_progress)
+    
+    def _flush_progress(self):
+        """Muestra el último avance registrado"""
+        # Bajar la marca antes de leer: un aviso posterior programa otro refresco
+        self._progress_scheduled = False
+        progress, self._pending_progress = self._pending_progress, None
+        if progress is None:
+            return
         
-        threading.Thread(target=analyze_thread, daemon=True).start()
+        fraction, message = progress
+        if self.progress_bar is not None:
+            self.progress_bar.set(fraction)
+        self.progress_var.set(f"🔍 {message}")
     
-    def on_analysis_complete(self):
+    def _on_analysis_done(self, future: Future):
+        """Despacha el resultado del análisis"""
+        # Descartar avances que aún no se mostraron
+        self._pending_progress = None
+        error = future.exception()
+        if error is not None:
+            self.on_analysis_error(f"Error analizando esquema: {str(error)}")
+            return
+        
+        self.source_schema_info, summary = future.result()
+        self.on_analysis_complete(summary)
+    
+    def on_analysis_complete(self, summary: Dict[str, int]):
         """Maneja la finalización del análisis con estilo moderno"""
-        self.progress_bar.stop()
-        self.progress_bar.set(1.0)
-        self.progress_var.set("✅ Análisis completado")
         self.analyze_btn.configure(text="🚀 Analizar Esquema", state="normal")
         
-        if self.source_schema_info:
-            # Actualizar visualización
-            self.viz_frame.update_schema_info(self.source_schema_info)
-            
-            # Habilitar botones de acción
-            self.select_tables_btn.configure(state="normal")
-            self.transfer_btn.configure(state="normal") 
-            self.export_btn.configure(state="normal")
-            
-            # Mostrar resumen moderno
-            total_objects = (
-                len(self.source_schema_info.objects.tables) +
-                len(self.source_schema_info.objects.views) +
-                len(self.source_schema_info.objects.sequences) +
-                len(self.source_schema_info.objects.procedures) +
-                len(self.source_schema_info.objects.triggers) +
-                len(self.source_schema_info.objects.indexes)
-            )
-            
-            total_rows = sum(t.row_count for t in self.source_schema_info.objects.tables.values())
-            
-            messagebox.showinfo("🎉 Análisis Completo", 
-                              f"Esquema analizado exitosamente:\n\n"
-                              f"📊 Objetos totales: {total_objects}\n"
-                              f"📋 Tablas: {len(self.source_schema_info.objects.tables)}\n"
-                              f"💾 Filas totales: {total_rows:,}")
+        # Esquema vacío: nada que visualizar ni transferir
+        if not summary["total_objects"]:
+            self.progress_var.set("⚠️ Esquema vacío")
+            # No dejar a la vista las pestañas del esquema anterior
+            self.viz_frame.clear()
+            if self.progress_bar is not None:
+                self.progress_bar.set(0)
+                for btn in (self.select_tables_btn, self.transfer_btn, self.export_btn):
+                    btn.configure(state="disabled")
+            return
+        
+        if self.progress_bar is None:
+            self._build_actions_panel(self._left_panel)
+        self.progress_bar.set(1.0)
+        
+        # Actualizar visualización
+        self.viz_frame.update_schema_info(self.source_schema_info)
+        
+        # Habilitar botones de acción
+        self.select_tables_btn.configure(state="normal")
+        self.transfer_btn.configure(state="normal")
+        self.export_btn.configure(state="normal")
+        
+        # Resumen en la barra de estado, sin diálogo modal
+        self.progress_var.set(f"✅ {summary['total_objects']} objetos · "
+                              f"{summary['total_tables']} tablas · "
+                              f"{summary['total_rows']:,} filas")
     
     def on_analysis_error(self, error_msg: str):
         """Maneja errores en el análisis con estilo moderno"""
-        self.progress_bar.stop()
-        self.progress_bar.set(0)
+        if self.progress_bar is not None:
+            self.progress_bar.set(0)
         self.progress_var.set("❌ Error en análisis")
         self.analyze_btn.configure(text="🚀 Analizar Esquema", state="normal")
         messagebox.showerror("💥 Error de Análisis", error_msg)
@@ -1088,21 +1555,15 @@ con interfaz moderna usando CustomTkinter.
     # Métodos placeholder para funcionalidades existentes
     def select_tables(self):
         """Placeholder para selección de tablas"""
-        messagebox.showinfo("🚧 En Desarrollo", 
-                          "Funcionalidad de selección de tablas\n"
-                          "será implementada próximamente")
+        messagebox.showinfo("🚧 En Desarrollo", _WIP_TEXT["select_tables"])
     
     def start_transfer(self):
         """Placeholder para transferencia"""
-        messagebox.showinfo("🚧 En Desarrollo",
-                          "Funcionalidad de transferencia\n" 
-                          "será implementada próximamente")
+        messagebox.showinfo("🚧 En Desarrollo", _WIP_TEXT["start_transfer"])
     
     def show_export_dialog(self):
         """Placeholder para diálogo de exportar"""
-        messagebox.showinfo("🚧 En Desarrollo",
-                          "Funcionalidad de exportación\n"
-                          "será implementada próximamente")
+        messagebox.showinfo("🚧 En Desarrollo", _WIP_TEXT["export"])
     
     def save_config(self):
         """Placeholder para guardar config"""
@@ -1122,7 +1583,10 @@ con interfaz moderna usando CustomTkinter.
             self.root.mainloop()
         finally:
             # Limpiar recursos
-            self.db_manager.close_all_connections()
+            self.executor.shutdown(wait=False)
+            # Sin importar los módulos de BD si nunca llegaron a cargarse
+            if self._db_manager is not None:
+                self._db_manager.close_all_connections()
 
 
 # Alias para compatibilidad
@@ -1130,5 +1594,9 @@ MainGUI = ModernMainGUI
 
 
 if __name__ == "__main__":
+    # El logging lo configura el punto de entrada (app.py o este bloque), no la
+    # GUI: en INFO SQLAlchemy registra cada consulta del análisis
+    logging.basicConfig(level=logging.INFO if os.environ.get("ELPASADOR_DEBUG") else logging.WARNING)
+    
     app = ModernMainGUI()
     app.run()
\ No newline at end of file
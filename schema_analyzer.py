@@ -4,8 +4,8 @@ Incluye análisis de dependencias entre tablas
 """
 
 import logging
-from typing import Dict, List, Set, Optional, Tuple, Any
-from dataclasses import dataclass
+from typing import Callable, Dict, List, Set, Optional, Tuple, Any
+from dataclasses import dataclass, field
 from database_manager import DatabaseManager
 from sqlalchemy import text
 from sqlalchemy.engine import Engine
@@ -47,6 +47,7 @@ class TableInfo:
     row_count: int
     dependencies: Set[str]  # Tablas de las que depende
     dependents: Set[str]    # Tablas que dependen de esta
+    row_count_str: str = '0'  # row_count con separador de miles, para la UI
 
 
 @dataclass
@@ -128,6 +129,34 @@ class SchemaInfo:
     objects: SchemaObjects
     dependency_order: List[str]  # Orden correcto para inserción de tablas
     creation_order: List[Tuple[str, str]]  # (tipo_objeto, nombre) en orden de creación
+    total_tables: int = 0  # Totales calculados una vez al analizar
+    total_rows: int = 0
+    total_fks: int = 0
+    counts: Dict[str, int] = field(default_factory=dict)  # Objetos por categoría
+    stats_text: str = ''  # Resumen de objetos por categoría para la UI
+    
+    def update_totals(self):
+        """Recalcula totales, conteos por categoría y el resumen de texto"""
+        objects = self.objects
+        self.total_tables = len(objects.tables)
+        self.total_rows = sum(t.row_count for t in objects.tables.values())
+        self.total_fks = sum(len(t.foreign_keys) for t in objects.tables.values())
+        
+        counts = {
+            'tables': len(objects.tables),
+            'views': len(objects.views),
+            'sequences': len(objects.sequences),
+            'procedures': len(objects.procedures),
+            'triggers': len(objects.triggers),
+            'indexes': len(objects.indexes)
+        }
+        self.counts = counts
+        self.stats_text = (f"📊 Tablas: {counts['tables']}\n"
+                           f"👁 Vistas: {counts['views']}\n"
+                           f"🔢 Secuencias: {counts['sequences']}\n"
+                           f"⚙️ Procedimientos: {counts['procedures']}\n"
+                           f"🎯 Triggers: {counts['triggers']}\n"
+                           f"📇 Índices: {counts['indexes']}")
 
 
 class SchemaAnalyzer:
@@ -141,8 +170,13 @@ class SchemaAnalyzer:
                       selected_tables: Optional[List[str]] = None,
                       include_views: bool = True, include_procedures: bool = True,
                       include_sequences: bool = True, include_triggers: bool = True,
-                      include_indexes: bool = True) -> SchemaInfo:
-        """Analiza un esquema completo y retorna toda la información necesaria"""
+                      include_indexes: bool = True,
+                      progress_callback: Optional[Callable[[float, str], None]] = None) -> SchemaInfo:
+        """Analiza un esquema completo y retorna toda la información necesaria
+        
+        progress_callback recibe (fracción 0-1, mensaje) tras cada tabla y
+        al pasar al resto de objetos.
+        """
         
         self.logger.info(f"Analizando esquema completo: {schema_name}")
         
@@ -167,10 +201,18 @@ class SchemaAnalyzer:
         all_tables = self.db_manager.get_tables(engine, db_type, schema_name)
         tables_to_analyze = selected_tables if selected_tables else all_tables
         
-        for table_name in tables_to_analyze:
+        total = len(tables_to_analyze)
+        for i, table_name in enumerate(tables_to_analyze, 1):
             if table_name in all_tables:
                 table_info = self._analyze_table(engine, db_type, schema_name, table_name)
                 schema_objects.tables[table_name] = table_info
+            
+            # Las tablas son la mayor parte del trabajo: 0 - 0.8
+            if progress_callback:
+                progress_callback(0.8 * i / total, f"Tabla {i}/{total}: {table_name}")
+        
+        if progress_callback:
+            progress_callback(0.8, "Analizando otros objetos...")
         
         # Analizar otros objetos si están habilitados
         if include_sequences:
@@ -202,6 +244,9 @@ class SchemaAnalyzer:
         # Determinar orden de creación para todos los objetos
         schema_info.creation_order = self._calculate_creation_order(schema_info)
         
+        # Totales para resúmenes y confirmaciones
+        schema_info.update_totals()
+        
         return schema_info
     
     def _analyze_table(self, engine: Engine, db_type: str, schema_name: str, table_name: str) -> TableInfo:
@@ -238,6 +283,7 @@ class SchemaAnalyzer:
                 
                 # Obtener conteo de filas
                 table_info.row_count = self._get_row_count(conn, db_type, schema_name, table_name)
+                table_info.row_count_str = f"{table_info.row_count:,}"
                 
                 # Marcar columnas que son FK y PK
                 self._mark_key_columns(table_info)